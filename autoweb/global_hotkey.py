@@ -11,6 +11,7 @@ Default shortcut: Ctrl+Shift+P (configurable in settings)
 
 import ctypes
 from ctypes import wintypes
+import functools
 import threading
 import time
 import logging
@@ -41,6 +42,41 @@ VK_MAP = {
 WM_HOTKEY = 0x0312
 
 
+def format_shortcut(modifiers: int, vk_code: int) -> str:
+    """
+    Get a human-readable name like "Ctrl+Shift+P" for a key combination.
+
+    Args:
+        modifiers: Modifier key combination
+        vk_code: Virtual key code
+
+    Returns:
+        Shortcut name
+    """
+    parts = []
+    if modifiers & MOD_CTRL:
+        parts.append("Ctrl")
+    if modifiers & MOD_SHIFT:
+        parts.append("Shift")
+    if modifiers & MOD_ALT:
+        parts.append("Alt")
+    if modifiers & MOD_WIN:
+        parts.append("Win")
+
+    # Find key name
+    key_name = None
+    for name, code in VK_MAP.items():
+        if code == vk_code:
+            key_name = name
+            break
+
+    if key_name is None:
+        key_name = f"0x{vk_code:02X}"
+
+    parts.append(key_name)
+    return "+".join(parts)
+
+
 class GlobalHotkey:
     """
     Manages a system-wide global hotkey using Windows RegisterHotKey API.
@@ -173,34 +209,16 @@ class GlobalHotkey:
 
     def _get_shortcut_name(self) -> str:
         """Get human-readable name for the current shortcut."""
-        parts = []
-        if self._modifiers & MOD_CTRL:
-            parts.append("Ctrl")
-        if self._modifiers & MOD_SHIFT:
-            parts.append("Shift")
-        if self._modifiers & MOD_ALT:
-            parts.append("Alt")
-        if self._modifiers & MOD_WIN:
-            parts.append("Win")
-
-        # Find key name
-        key_name = None
-        for name, code in VK_MAP.items():
-            if code == self._vk_code:
-                key_name = name
-                break
-
-        if key_name is None:
-            key_name = f"0x{self._vk_code:02X}"
-
-        parts.append(key_name)
-        return "+".join(parts)
+        return format_shortcut(self._modifiers, self._vk_code)
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def parse_shortcut(shortcut_str: str) -> tuple:
         """
         Parse a shortcut string like "Ctrl+Shift+P" into modifiers and vk_code.
 
+        Results are cached, so re-submitting the same setting skips parsing.
+
         Args:
             shortcut_str: Human-readable shortcut string
 
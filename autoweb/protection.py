@@ -88,6 +88,9 @@ class ApplicationProtection:
         self._power_window = None
         self._should_shutdown = False
         self._shutdown_reason = None
+        # Set together with _should_shutdown so callers can block on it
+        # instead of polling the flag
+        self._shutdown_event = threading.Event()
         
         logger.info("ApplicationProtection initialized")
     
@@ -173,6 +176,44 @@ class ApplicationProtection:
         """Get the reason for shutdown."""
         return self._shutdown_reason
     
+    def wait_for_shutdown(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a shutdown event (logoff, sleep, lock, ...) is detected.
+        
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if the application should shutdown, False on timeout
+        """
+        return self._shutdown_event.wait(timeout)
+    
+    def request_shutdown(self, reason: str) -> None:
+        """
+        Wake wait_for_shutdown() without the cleanup and forced exit that
+        a detected system event triggers - the waiter unwinds on its own.
+        
+        Args:
+            reason: Reason reported by shutdown_reason
+        """
+        if not self._shutdown_event.is_set():
+            self._shutdown_reason = reason
+            self._shutdown_event.set()
+    
+    def wait_with_status(self, label: str, interval: float = 1.0) -> None:
+        """
+        Block until a shutdown event is detected, showing the seconds
+        elapsed after `label` on one console line.
+        
+        Args:
+            label: Status text shown before the counter
+            interval: Seconds between counter updates
+        """
+        start = time.monotonic()
+        while not self.wait_for_shutdown(interval):
+            sys.stdout.write(f"{label} {int(time.monotonic() - start):03d}s\r")
+            sys.stdout.flush()
+    
     def _is_emergency_disabled(self) -> bool:
         """Check if protection is disabled by emergency file."""
         try:
@@ -332,6 +373,7 @@ class ApplicationProtection:
             
         self._should_shutdown = True
         self._shutdown_reason = reason
+        self._shutdown_event.set()
         logger.info(f"Graceful shutdown initiated: {reason}")
         
         # Run cleanup functions
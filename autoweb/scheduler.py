@@ -78,6 +78,7 @@ class SchedulerState:
     cycle_count: int = 0          # Number of completed cycles
     current_app: str = ""         # Name of currently active application
     last_action: str = ""         # Description of last action taken
+    action_seq: int = 0           # Bumped per reported action, repeats included
     is_running: bool = False
     next_action_in: int = 0       # Seconds until next action
     total_runtime: Optional[int] = None  # None = run until stopped
@@ -252,6 +253,7 @@ class AutomationScheduler:
                 cycle_count=self._state.cycle_count,
                 current_app=self._state.current_app,
                 last_action=self._state.last_action,
+                action_seq=self._state.action_seq,
                 is_running=self._state.is_running,
                 next_action_in=self._state.next_action_in,
                 total_runtime=self._state.total_runtime,
@@ -264,16 +266,25 @@ class AutomationScheduler:
         """
         Update state and notify observers (thread-safe).
         
+        Observers are only notified when at least one attribute changed value,
+        or when an action is reported (a repeat of the last one still counts).
+        
         Args:
             **kwargs: State attributes to update
         """
+        changed = False
         with self._state_lock:
             for key, value in kwargs.items():
-                if hasattr(self._state, key):
+                if hasattr(self._state, key) and getattr(self._state, key) != value:
                     setattr(self._state, key, value)
-        
-        # Notify UI of state change
-        if self._on_state_change:
+                    changed = True
+            if "last_action" in kwargs:
+                self._state.action_seq += 1
+                changed = True
+        
+        # Notify UI only when something actually changed - the phase loops
+        # call this every 100 ms, but the displayed values are whole seconds
+        if changed and self._on_state_change:
             self._on_state_change(self.state)
     
     def _on_user_activity(self, activity_type: ActivityType) -> None:
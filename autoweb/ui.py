@@ -27,18 +27,23 @@ Design Principles:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from typing import Optional
+from tkinter import ttk, scrolledtext
+from tkinter import font as tkfont
+from typing import Iterable, List, Optional, Tuple
+import collections
+import functools
 import logging
+import queue
+import re
 import sys
 import ctypes
 from ctypes import wintypes
 import threading
 import subprocess
-from datetime import datetime
+import time
 
 from .scheduler import AutomationScheduler, SchedulerState, AutomationPhase
-from .global_hotkey import GlobalHotkey, MOD_CTRL, MOD_SHIFT, VK_MAP
+from .global_hotkey import GlobalHotkey, MOD_CTRL, MOD_SHIFT, MOD_NOREPEAT, VK_MAP, format_shortcut
 from .force_logout import ForceLogoutHandler
 
 # Configure logging
@@ -55,28 +60,244 @@ GWL_EXSTYLE = -20
 WS_EX_LAYERED = 0x00080000
 LWA_ALPHA = 0x00000002
 
+# Window messages
+WM_QUIT = 0x0012
+WM_HOTKEY = 0x0312
+
 # Windows display affinity (screen capture blocking)
 WDA_NONE = 0x00000000
 WDA_MONITOR = 0x00000001
 WDA_EXCLUDEFROMCAPTURE = 0x00000011
 
 
-def _apply_capture_protection(tk_window: tk.Misc, label: str = "window") -> None:
-    """Attempt to block screen capture for the given window."""
+# user32/kernel32 bindings resolved once with explicit prototypes (Windows only)
+try:
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _GetParent = _user32.GetParent
+    _GetParent.argtypes = [wintypes.HWND]
+    _GetParent.restype = wintypes.HWND
+
+    _SetWindowDisplayAffinity = _user32.SetWindowDisplayAffinity
+    _SetWindowDisplayAffinity.argtypes = [wintypes.HWND, wintypes.DWORD]
+    _SetWindowDisplayAffinity.restype = wintypes.BOOL
+
+    _GetWindowLongW = _user32.GetWindowLongW
+    _GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLongW.restype = wintypes.LONG
+
+    _SetWindowLongW = _user32.SetWindowLongW
+    _SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    _SetWindowLongW.restype = wintypes.LONG
+
+    _SetLayeredWindowAttributes = _user32.SetLayeredWindowAttributes
+    _SetLayeredWindowAttributes.argtypes = [
+        wintypes.HWND, wintypes.COLORREF, wintypes.BYTE, wintypes.DWORD
+    ]
+    _SetLayeredWindowAttributes.restype = wintypes.BOOL
+
+    _RegisterHotKey = _user32.RegisterHotKey
+    _RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+    _RegisterHotKey.restype = wintypes.BOOL
+
+    _UnregisterHotKey = _user32.UnregisterHotKey
+    _UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+    _UnregisterHotKey.restype = wintypes.BOOL
+
+    _GetMessageW = _user32.GetMessageW
+    _GetMessageW.argtypes = [
+        ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT
+    ]
+    _GetMessageW.restype = wintypes.BOOL
+
+    _PostThreadMessageW = _user32.PostThreadMessageW
+    _PostThreadMessageW.argtypes = [
+        wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM
+    ]
+    _PostThreadMessageW.restype = wintypes.BOOL
+
+    _LockWorkStation = _user32.LockWorkStation
+    _LockWorkStation.argtypes = []
+    _LockWorkStation.restype = wintypes.BOOL
+
+    _GetCurrentThreadId = _kernel32.GetCurrentThreadId
+    _GetCurrentThreadId.argtypes = []
+    _GetCurrentThreadId.restype = wintypes.DWORD
+except (AttributeError, OSError):
+    _user32 = None
+    _kernel32 = None
+    _GetParent = None
+    _SetWindowDisplayAffinity = None
+    _GetWindowLongW = None
+    _SetWindowLongW = None
+    _SetLayeredWindowAttributes = None
+    _RegisterHotKey = None
+    _UnregisterHotKey = None
+    _GetMessageW = None
+    _PostThreadMessageW = None
+    _LockWorkStation = None
+    _GetCurrentThreadId = None
+
+
+# Display affinity that worked on this OS (None until a probe succeeds)
+_CAPTURE_AFFINITY: Optional[int] = None
+
+
+def _apply_capture_protection(
+    tk_window: tk.Misc,
+    label: str = "window",
+    *,
+    _get_parent=_GetParent,
+    _swda=_SetWindowDisplayAffinity,
+    _exclude: int = WDA_EXCLUDEFROMCAPTURE,
+    _monitor: int = WDA_MONITOR,
+    _log: logging.Logger = logger,
+) -> None:
+    """
+    Attempt to block screen capture for the given window.
+
+    The keyword-only arguments bind module globals as locals at definition
+    time and are not meant to be passed by callers.
+    """
+    global _CAPTURE_AFFINITY
     try:
-        hwnd = ctypes.windll.user32.GetParent(tk_window.winfo_id())
-        result = ctypes.windll.user32.SetWindowDisplayAffinity(
-            hwnd, WDA_EXCLUDEFROMCAPTURE
-        )
-        if result == 0:
-            ctypes.windll.user32.SetWindowDisplayAffinity(hwnd, WDA_MONITOR)
-            logger.warning(
-                f"WDA_EXCLUDEFROMCAPTURE not supported for {label}, fell back to WDA_MONITOR"
+        hwnd = _get_parent(tk_window.winfo_id())
+        if not hwnd:
+            # Not mapped yet - there is no frame window, and nothing to learn
+            _log.warning("No window handle for %s yet, capture protection skipped", label)
+            return
+        affinity = _CAPTURE_AFFINITY
+        if affinity is not None and _swda(hwnd, affinity):
+            # Support already known - a single call with the cached affinity
+            return
+
+        # Probe; only a call that succeeded decides the cached affinity
+        if _swda(hwnd, _exclude):
+            _CAPTURE_AFFINITY = _exclude
+            _log.info("Screen capture blocking enabled for %s", label)
+        elif _swda(hwnd, _monitor):
+            _CAPTURE_AFFINITY = _monitor
+            _log.warning(
+                "WDA_EXCLUDEFROMCAPTURE not supported for %s, fell back to WDA_MONITOR", label
+            )
+        else:
+            _log.error(
+                "Failed to set screen capture protection for %s (error: %s)",
+                label, ctypes.get_last_error()
             )
+    except Exception:
+        _log.exception("Failed to set screen capture protection for %s", label)
+
+
+@functools.lru_cache(maxsize=1)
+def _screen_size(root: tk.Misc) -> Tuple[int, int]:
+    """Return (width, height) of the screen, cached until the root is next mapped."""
+    return root.winfo_screenwidth(), root.winfo_screenheight()
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_mmss(seconds: int) -> str:
+    """Format seconds as MM:SS (memoized - countdowns repeat the same values)."""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+# Well-formed settings input: "mm:ss" or a plain non-negative number
+_MMSS_RE = re.compile(r"(\d+)\s*:\s*(\d+)")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d*)?|\.\d+")
+
+
+def _parse_time_to_seconds(value: str, default_seconds: int, assume_minutes: bool = True) -> int:
+    """
+    Parse a settings value ("mm:ss" or a number) into seconds.
+
+    Args:
+        value: Raw entry text
+        default_seconds: Returned when the value is empty or invalid
+        assume_minutes: Treat a plain number as minutes instead of seconds
+
+    Returns:
+        Time in seconds
+    """
+    text = value.strip()
+    try:
+        match = _MMSS_RE.fullmatch(text)
+        if match:
+            return int(match.group(1)) * 60 + int(match.group(2))
+        if _NUMBER_RE.fullmatch(text):
+            number = float(text)
+        else:
+            # Uncommon spellings float() still accepts (e.g. "1e1"), else the default
+            if not text or ":" in text:
+                return default_seconds
+            number = float(text)
+            if not number >= 0:  # Negative or nan
+                return default_seconds
+        if assume_minutes:
+            number *= 60
+        return int(round(number))
+    except (ValueError, OverflowError):
+        # e.g. "inf" or an exponent too large for a float
+        return default_seconds
+
+
+def _collapse_repeats(
+    pending: Iterable[Tuple[float, str]], last_msg: Optional[str], last_count: int
+) -> Tuple[List[Tuple[float, str, int]], bool, Optional[str], int]:
+    """
+    Fold consecutive repeats of a log message into one counted entry.
+
+    Args:
+        pending: (time, message) pairs in arrival order
+        last_msg: Newest message already in the log, or None
+        last_count: How many times in a row last_msg arrived
+
+    Returns:
+        (entries, replace_last, last_msg, last_count): (time, message, count)
+        entries to write, whether entries[0] continues the line already
+        shown, and the repeat state to carry into the next drain
+    """
+    entries = []
+    replace_last = False
+    for ts, message in pending:
+        if message == last_msg:
+            last_count += 1
+            if entries:
+                entries[-1] = (ts, message, last_count)
+            else:
+                entries.append((ts, message, last_count))
+                replace_last = True
         else:
-            logger.info(f"Screen capture blocking enabled for {label}")
-    except Exception as e:
-        logger.error(f"Failed to set screen capture protection for {label}: {e}")
+            last_msg = message
+            last_count = 1
+            entries.append((ts, message, 1))
+    return entries, replace_last, last_msg, last_count
+
+
+def _redraw_delay(
+    state: SchedulerState, last_state: Optional[SchedulerState],
+    elapsed: float, min_interval: float
+) -> float:
+    """
+    Decide how long to hold back a status redraw.
+
+    Same-phase updates are limited to one per min_interval; the first
+    state and phase changes always render immediately.
+
+    Args:
+        state: Snapshot about to be rendered
+        last_state: Snapshot rendered last, or None
+        elapsed: Seconds since the last redraw
+        min_interval: Minimum seconds between same-phase redraws
+
+    Returns:
+        Seconds to wait before rendering (0.0 = render now)
+    """
+    if last_state is None or state.phase != last_state.phase or elapsed >= min_interval:
+        return 0.0
+    return min_interval - elapsed
+
 
 # Hotkey registration - Using Ctrl+Shift+Q (easier to press)
 MOD_CTRL = 0x0002
@@ -100,26 +321,106 @@ class Colors:
     ERROR = "#f38ba8"           # Red for stopped
     TEXT = "#cdd6f4"            # Light text
     TEXT_DIM = "#6c7086"        # Dimmed text
+    SUCCESS_ACTIVE = "#8bc78f"  # Pressed/hover green button
+    ERROR_ACTIVE = "#d97a8f"    # Pressed/hover red button
+
+
+def _init_styles(root: tk.Misc) -> ttk.Style:
+    """
+    Register the ttk styles used by plain container frames.
+
+    Each palette color is resolved once for its style instead of being
+    parsed again for every frame that would otherwise pass ``bg=``.
+    """
+    style = ttk.Style(root)
+    style.configure("Background.TFrame", background=Colors.BACKGROUND)
+    style.configure("Surface.TFrame", background=Colors.SURFACE)
+    return style
 
 
 class Fonts:
-    """Application fonts."""
+    """
+    Application fonts.
+
+    Declared as font tuples; ``load()`` swaps them for named Tk fonts once a
+    root window exists, so Tk resolves and measures each font a single time
+    and every widget shares the cached metrics.
+    """
     TITLE = ("Segoe UI", 16, "bold")
     HEADING = ("Segoe UI", 12, "bold")
     BODY = ("Segoe UI", 10)
     MONO = ("Consolas", 10)
     TIMER = ("Segoe UI", 32, "bold")
     STATUS = ("Segoe UI", 14, "bold")
+    COUNTER = ("Segoe UI", 24, "bold")
+    TIP = ("Segoe UI", 9)
+    NOTE = ("Segoe UI", 8)
+    NOTE_BOLD = ("Segoe UI", 8, "bold")
+
+    _specs: Optional[dict] = None
+
+    @classmethod
+    def load(cls, root: tk.Misc) -> None:
+        """Replace the font tuples with named fonts bound to ``root``."""
+        if cls._specs is None:
+            cls._specs = {
+                name: value for name, value in vars(cls).items()
+                if name.isupper() and isinstance(value, tuple)
+            }
+        for name, spec in cls._specs.items():
+            setattr(cls, name, tkfont.Font(root=root, font=spec))
 
 
 # ============================================================================
 # Warning Dialog
 # ============================================================================
 
+# Consent dialog summary lines ({} placeholders filled from the settings dict).
+# The leading/trailing "" entries produce the blank first and last lines.
+_SETTINGS_LINES = (
+    "",
+    "\u23f1 Active Duration: {active_min}-{active_max}",
+    "\u23f8 Pause Duration: {idle_min}-{idle_max}",
+    "\ud83e\ude80 Idle Keepalive: {idle_keepalive}",
+    "\ud83d\udd01 Refresh: {refresh}",
+    "\ud83d\udd04 App Switch: {app_switch}",
+    "\u23f1 Total Runtime: {total_runtime}",
+    "\ud83d\udd01 Repeat Screens: {repeat_screens}",
+    "\ud83d\udd11 Shortcut: {shortcut}",
+    "\u26a0 Force Logout: {force_logout}",
+    "\ud83d\udeba Simple Logout: {simple_logout}",
+    "\ud83d\udd12 Auto Lock: {auto_lock}",
+    "",
+    "The app will PAUSE on mouse clicks or keyboard presses.",
+    "Mouse movement is ignored.",
+    "Resumes after 30 seconds of inactivity.",
+    "",
+)
+
+# Values used for optional settings keys
+_SETTINGS_DEFAULTS = {
+    'idle_keepalive': '02:00',
+    'refresh': 'OFF',
+    'shortcut': 'Ctrl+Shift+P',
+    'force_logout': 'OFF',
+    'simple_logout': 'OFF',
+    'auto_lock': 'OFF',
+}
+
+# Privacy Shield variant never depends on the settings - build it once
+_PRIVACY_SETTINGS_TEXT = "\n".join(
+    line.split(":", 1)[0] + ": Hidden" if "{" in line else line
+    for line in _SETTINGS_LINES
+)
+
 class ConsentDialog:
     """
     Confirmation dialog that shows user settings before starting.
     NO shortcut info shown here - just settings confirmation.
+
+    The Toplevel is built on the first ``show()`` and then kept alive:
+    closing it only withdraws the window, and later calls re-show it with
+    the settings label updated in place.
     """
     
     def __init__(self, parent: tk.Tk, settings: dict, privacy_mode: bool = False):
@@ -131,30 +432,54 @@ class ConsentDialog:
             settings: Dictionary with active_min, active_max, idle_min, idle_max, app_switch, total_runtime
         """
         self.parent = parent
-        self.settings = settings
         self.confirmed = False
-        self.privacy_mode = privacy_mode
-    
-    def show(self) -> bool:
+        self._dialog: Optional[tk.Toplevel] = None
+        self._settings_label: Optional[tk.Label] = None
+        self._done_var: Optional[tk.BooleanVar] = None
+        self._grabbed = False
+        self.set_settings(settings, privacy_mode)
+
+    def set_settings(self, settings: dict, privacy_mode: bool = False) -> None:
         """
-        Show the confirmation dialog.
-        
-        Returns:
-            True if user confirmed, False otherwise
+        Update the settings shown by the next ``show()`` call.
+
+        Args:
+            settings: Settings dictionary (see ``__init__``)
+            privacy_mode: Whether to hide the setting values
         """
-        dialog = tk.Toplevel(self.parent)
+        self.settings = settings
+        self.privacy_mode = privacy_mode
+
+        # Build the display text once per settings change, not per show()
+        if self.privacy_mode:
+            self._settings_text = _PRIVACY_SETTINGS_TEXT
+        else:
+            values = {**_SETTINGS_DEFAULTS, **self.settings}
+            self._settings_text = "\n".join(line.format_map(values) for line in _SETTINGS_LINES)
+
+    def _build(self) -> None:
+        """Create the dialog window and its widgets (first show only)."""
+        # Nothing but the buttons needs to sit in the focus traversal order
+        dialog = tk.Toplevel(self.parent, takefocus=0)
+        # Build the whole widget tree while unmapped so Tk maps and lays it
+        # out once on deiconify() instead of relayouting after every pack()
+        dialog.withdraw()
         dialog.title("Confirm Settings")
-        dialog.geometry("450x560")  # Taller dialog to accommodate all content
+        # Size and center in one geometry call (taller dialog to accommodate
+        # all content); the parent is already realized so no layout pass is needed
+        screen_w, screen_h = _screen_size(self.parent)
+        x = (screen_w - 450) // 2
+        y = (screen_h - 560) // 2
+        dialog.geometry(f"450x560+{x}+{y}")
         dialog.configure(bg=Colors.BACKGROUND)
         dialog.transient(self.parent)
-        dialog.grab_set()
-        _apply_capture_protection(dialog, "consent dialog")
-        
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() - 450) // 2
-        y = (dialog.winfo_screenheight() - 560) // 2
-        dialog.geometry(f"450x560+{x}+{y}")
+
+        # Fixed-size dialog: lay children out with one grid solve instead of
+        # letting each pack() propagate a new requested size upwards
+        dialog.pack_propagate(False)
+        dialog.grid_propagate(False)
+        dialog.columnconfigure((0, 1), weight=1)
+        dialog.rowconfigure(2, weight=1)
         
         # Title
         title_label = tk.Label(
@@ -162,105 +487,112 @@ class ConsentDialog:
             text="✓ Confirm Your Settings",
             font=Fonts.TITLE,
             bg=Colors.BACKGROUND,
-            fg=Colors.PRIMARY
+            fg=Colors.PRIMARY,
+            takefocus=0
         )
-        title_label.pack(pady=(20, 15))
-        
-        # Settings display
-        settings_frame = tk.Frame(dialog, bg=Colors.SURFACE, padx=20, pady=15)
-        settings_frame.pack(fill=tk.X, padx=20, pady=10)
-        
-        if self.privacy_mode:
-            settings_text = """
-\u23f1 Active Duration: Hidden
-\u23f8 Pause Duration: Hidden
-\ud83e\ude80 Idle Keepalive: Hidden
-\ud83d\udd01 Refresh: Hidden
-\ud83d\udd04 App Switch: Hidden
-\u23f1 Total Runtime: Hidden
-\ud83d\udd01 Repeat Screens: Hidden
-\ud83d\udd11 Shortcut: Hidden
-\u26a0 Force Logout: Hidden
-\ud83d\udeba Simple Logout: Hidden
-\ud83d\udd12 Auto Lock: Hidden
-
-The app will PAUSE on mouse clicks or keyboard presses.
-Mouse movement is ignored.
-Resumes after 30 seconds of inactivity.
-"""
-        else:
-            settings_text = f"""
-\u23f1 Active Duration: {self.settings['active_min']}-{self.settings['active_max']}
-\u23f8 Pause Duration: {self.settings['idle_min']}-{self.settings['idle_max']}
-\ud83e\ude80 Idle Keepalive: {self.settings.get('idle_keepalive', '02:00')}
-\ud83d\udd01 Refresh: {self.settings.get('refresh', 'OFF')}
-\ud83d\udd04 App Switch: {self.settings['app_switch']}
-\u23f1 Total Runtime: {self.settings['total_runtime']}
-\ud83d\udd01 Repeat Screens: {self.settings['repeat_screens']}
-\ud83d\udd11 Shortcut: {self.settings.get('shortcut', 'Ctrl+Shift+P')}
-\u26a0 Force Logout: {self.settings.get('force_logout', 'OFF')}
-\ud83d\udeba Simple Logout: {self.settings.get('simple_logout', 'OFF')}
-\ud83d\udd12 Auto Lock: {self.settings.get('auto_lock', 'OFF')}
-
-The app will PAUSE on mouse clicks or keyboard presses.
-Mouse movement is ignored.
-Resumes after 30 seconds of inactivity.
-"""
+        title_label.grid(row=0, column=0, columnspan=2, pady=(20, 15))
         
-        settings_label = tk.Label(
-            settings_frame,
-            text=settings_text,
+        # Settings display - a single padded label (no wrapper frame), with
+        # the wrap width fixed to the dialog's inner width
+        self._settings_label = tk.Label(
+            dialog,
+            text=self._settings_text,
             font=Fonts.BODY,
             bg=Colors.SURFACE,
             fg=Colors.TEXT,
-            justify=tk.LEFT
+            justify=tk.LEFT,
+            anchor=tk.W,
+            padx=20,
+            pady=15,
+            wraplength=370,
+            takefocus=0
         )
-        settings_label.pack()
-        
-        # Buttons - at bottom with enough space
-        button_frame = tk.Frame(dialog, bg=Colors.BACKGROUND)
-        button_frame.pack(side=tk.BOTTOM, pady=30)  # Pack at bottom
+        self._settings_label.grid(row=1, column=0, columnspan=2, sticky="ew", padx=20, pady=10)
         
-        def on_confirm():
-            self.confirmed = True
-            dialog.destroy()
-        
-        def on_cancel():
-            self.confirmed = False
-            dialog.destroy()
+        # Buttons - placed directly in the bottom row with enough space
         
         confirm_btn = tk.Button(
-            button_frame,
+            dialog,
             text="START NOW",
-            command=on_confirm,
-            font=("Segoe UI", 14, "bold"),
+            command=self._on_confirm,
+            font=Fonts.STATUS,
             bg=Colors.SUCCESS,
             fg=Colors.BACKGROUND,
-            activebackground="#8bc78f",
+            activebackground=Colors.SUCCESS_ACTIVE,
             padx=40,
             pady=15,
             cursor="hand2",
             relief=tk.RAISED,
             bd=3
         )
-        confirm_btn.pack(side=tk.LEFT, padx=15)
+        confirm_btn.grid(row=2, column=0, sticky="se", padx=15, pady=30)
         
         cancel_btn = tk.Button(
-            button_frame,
+            dialog,
             text="✗ Back",
-            command=on_cancel,
+            command=self._on_cancel,
             font=Fonts.BODY,
             bg=Colors.ERROR,
             fg=Colors.BACKGROUND,
-            activebackground="#d97a8f",
+            activebackground=Colors.ERROR_ACTIVE,
             padx=20,
             pady=8,
             cursor="hand2"
         )
-        cancel_btn.pack(side=tk.LEFT, padx=10)
+        cancel_btn.grid(row=2, column=1, sticky="sw", padx=10, pady=30)
+
+        # Closing via the title bar behaves like "Back"
+        dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
+
+        self._done_var = tk.BooleanVar(master=dialog, value=False)
+        self._dialog = dialog
+
+    def _on_confirm(self) -> None:
+        """Handle START NOW."""
+        self.confirmed = True
+        self._close()
+
+    def _on_cancel(self) -> None:
+        """Handle Back / window close."""
+        self.confirmed = False
+        self._close()
+
+    def _close(self) -> None:
+        """Hide the dialog (kept for reuse) and release the waiting show()."""
+        if self._grabbed:
+            self._dialog.grab_release()
+            self._grabbed = False
+        self._dialog.withdraw()
+        self._done_var.set(True)
+    
+    def show(self) -> bool:
+        """
+        Show the confirmation dialog.
+        
+        Returns:
+            True if user confirmed, False otherwise
+        """
+        built = self._dialog is None or not self._dialog.winfo_exists()
+        if built:
+            self._grabbed = False
+            self._build()
+        else:
+            self._settings_label.configure(text=self._settings_text)
+        
+        self.confirmed = False
+        
+        # Show the fully built dialog and make it modal
+        self._dialog.deiconify()
+        if built:
+            # Block screen capture once mapped - the frame HWND only exists
+            # after the first deiconify (the main window defers it the same way)
+            self._dialog.after_idle(_apply_capture_protection, self._dialog, "consent dialog")
+        if not self._grabbed:
+            self._dialog.grab_set()
+            self._grabbed = True
         
-        # Wait for dialog to close
-        self.parent.wait_window(dialog)
+        # Wait until confirm/cancel hides the dialog
+        self.parent.wait_variable(self._done_var)
         
         return self.confirmed
 
@@ -283,6 +615,8 @@ class AutoWebApp:
     
     # Hotkey ID for Win+F12
     HOTKEY_ID = 1
+    # Seconds a new hotkey listener waits for the previous one to unregister
+    HOTKEY_HANDOFF_TIMEOUT = 5.0
     DEFAULT_ACTIVE_MIN_SEC = 300
     DEFAULT_ACTIVE_MAX_SEC = 600
     DEFAULT_IDLE_MIN_SEC = 120
@@ -293,6 +627,72 @@ class AutoWebApp:
     DEFAULT_REFRESH_INTERVAL_SEC = 240  # 4 minutes
     DEFAULT_AUTO_LOCK_MONITOR_SEC = 300  # 5 minutes monitoring start time
     
+    # Paired mm:ss settings in the first rows of the settings panel:
+    # (attribute prefix, label, default text, note). Defaults are formatted
+    # once here rather than on every startup/reset.
+    _TIME_SETTING_ROWS = (
+        (
+            ("active_min", "▶️ Active Min (mm:ss):", _format_mmss(DEFAULT_ACTIVE_MIN_SEC), "Minimum active time"),
+            ("active_max", "▶️ Active Max (mm:ss):", _format_mmss(DEFAULT_ACTIVE_MAX_SEC), "Maximum active time"),
+        ),
+        (
+            ("idle_min", "⏸️ Pause Min (mm:ss):", _format_mmss(DEFAULT_IDLE_MIN_SEC), "Minimum pause time"),
+            ("idle_max", "⏸️ Pause Max (mm:ss):", _format_mmss(DEFAULT_IDLE_MAX_SEC), "Maximum pause time"),
+        ),
+        (
+            ("app_switch", "🔄 App Switch (mm:ss):", _format_mmss(DEFAULT_APP_SWITCH_SEC), "Time between screen changes"),
+            ("total_runtime", "⏱️ Total Runtime (mm:ss):", _format_mmss(DEFAULT_RUNTIME_SEC), "App auto-closes when done"),
+        ),
+    )
+    # mm:ss settings placed individually, same layout as above
+    _KEEPALIVE_SETTING = (
+        "idle_keepalive", "Idle Keepalive (mm:ss):", _format_mmss(DEFAULT_IDLE_KEEPALIVE_SEC),
+        "Heartbeat during pause (00:00 disables)"
+    )
+    _REFRESH_INTERVAL_SETTING = (
+        "refresh_interval", "Refresh Interval (mm:ss):", _format_mmss(DEFAULT_REFRESH_INTERVAL_SEC),
+        "Used only when Refresh is checked"
+    )
+    _AUTO_LOCK_MONITOR_SETTING = (
+        "auto_lock_monitor", "⏱️ Monitoring Start (mm:ss):", _format_mmss(DEFAULT_AUTO_LOCK_MONITOR_SEC),
+        "Time before monitoring begins"
+    )
+    _ALL_TIME_SETTINGS = (
+        *_TIME_SETTING_ROWS[0], *_TIME_SETTING_ROWS[1], *_TIME_SETTING_ROWS[2],
+        _KEEPALIVE_SETTING, _REFRESH_INTERVAL_SETTING, _AUTO_LOCK_MONITOR_SETTING,
+    )
+    _DEFAULT_RUNTIME_TEXT = _format_mmss(DEFAULT_RUNTIME_SEC)
+    
+    # Activity log batching
+    LOG_DRAIN_MS = 100        # Delay between log queue drains
+    LOG_MAX_LINES = 1000      # Trim the log widget once it grows past this
+    LOG_KEEP_LINES = 500      # Lines kept after trimming
+    LOG_HISTORY_LINES = 2000  # Formatted lines remembered outside the widget
+    
+    # Status label (text, color) per phase; anything else shows as stopped
+    _PHASE_STATUS = {
+        AutomationPhase.ACTIVE: ("▶️ ACTIVE", Colors.SUCCESS),
+        AutomationPhase.IDLE: ("💤 IDLE", Colors.WARNING),
+        AutomationPhase.WAITING_IDLE: ("⏸️ PAUSED", Colors.WARNING),
+        AutomationPhase.PAUSED: ("⏸️ PAUSED", Colors.WARNING),
+    }
+    _STOPPED_STATUS = ("⏹️ STOPPED", Colors.ERROR)
+    
+    # Next-action label (text, color) for the phases without a countdown
+    _NEXT_ACTION_STATIC = {
+        AutomationPhase.WAITING_IDLE: ("⏸️", Colors.WARNING),
+        AutomationPhase.PAUSED: ("⏸️", Colors.WARNING),
+    }
+    _NO_NEXT_ACTION = ("--", Colors.TEXT_DIM)
+    
+    # Bindtag carried only by the root window (see _on_root_map)
+    _ROOT_BINDTAG = "AutoWebRoot"
+    
+    # Virtual event that wakes the Tk thread to run callbacks from _post()
+    _UI_POSTED_EVENT = "<<AutoWebUiPosted>>"
+    # Minimum seconds between status redraws within the same phase
+    UI_MIN_INTERVAL = 0.25
+    
     def __init__(self, protection=None):
         """Initialize the main application window."""
         # Store protection object
@@ -300,20 +700,28 @@ class AutoWebApp:
         
         # Create main window
         self.root = tk.Tk()
-        self.root.title("AutoWeb - UI Automation Tool")
-        self.root.configure(bg=Colors.BACKGROUND)
-        self.root.resizable(True, True)
-        self.root.minsize(520, 600)
+        # The app has no menus - skip tear-off entries on any that get created
+        self.root.option_add("*tearOff", False)
+        Fonts.load(self.root)
+        self._style = _init_styles(self.root)
 
         # Screen-aware window sizing for laptop/tablet/large displays
-        screen_w = self.root.winfo_screenwidth()
-        screen_h = self.root.winfo_screenheight()
+        screen_w, screen_h = _screen_size(self.root)
         self._window_width = min(900, max(560, screen_w - 80))
         self._window_height = min(980, max(620, screen_h - 100))
-        self.root.geometry(f"{self._window_width}x{self._window_height}")
+        x = (screen_w - self._window_width) // 2
+        y = (screen_h - self._window_height) // 2
         
-        # Keep window always on top
-        self.root.attributes('-topmost', True)
+        # Title, background, size/position (centered, set before any widget
+        # exists so no layout pass is needed), resize limits and always-on-top
+        # in one Tcl eval instead of a call per setting
+        self.root.tk.eval(
+            "wm title . {AutoWeb - UI Automation Tool}; "
+            f". configure -background {Colors.BACKGROUND}; "
+            "wm resizable . 1 1; wm minsize . 520 600; "
+            f"wm geometry . {self._window_width}x{self._window_height}+{x}+{y}; "
+            "wm attributes . -topmost 1"
+        )
         
         # Set window icon (if available)
         try:
@@ -333,18 +741,31 @@ class AutoWebApp:
             on_before_logout=self._before_force_logout
         )
         
-        # Global pause/resume hotkey (Ctrl+Shift+P)
-        self._pause_resume_hotkey = None
+        # Shutdown guards (see _release_resources / _on_close)
+        self._cleanup_done = False
+        self._closed = False
         
         # Track consent
         self.consent_given = False
+        self._consent_dialog: Optional[ConsentDialog] = None
         
-        # Hotkey thread control
+        # Hotkey thread control (Ctrl+Shift+Q and the pause/resume shortcut).
+        # Each listener gets its own stop event; the id and event here are
+        # the current listener's, so a late-exiting old one can't disturb them.
         self._hotkey_thread = None
+        self._hotkey_thread_id = None
         self._hotkey_stop_event = threading.Event()
+        # (modifiers, vk_code) of the pause/resume hotkey the listener registered
+        self._installed_pause_shortcut: Optional[Tuple[int, int]] = None
+        # Pause/resume shortcut name last written to the activity log
+        self._last_shortcut_name: Optional[str] = None
         
-        # Privacy shield (redacts on-screen data)
+        # Privacy shield (redacts on-screen data). _privacy_enabled mirrors
+        # the checkbox so hot paths don't query the Tcl variable.
         self.privacy_mode = tk.BooleanVar(value=True)
+        self._privacy_enabled = True
+        # Log already shows the privacy placeholder (nothing to redraw)
+        self._privacy_placeholder_set = False
 
         # Force OS logout on user activity
         self.force_logout_var = tk.BooleanVar(value=False)
@@ -352,62 +773,192 @@ class AutoWebApp:
         # Simple logout (app only, not OS)
         self.simple_logout_var = tk.BooleanVar(value=False)
 
+        # Last application name rendered in app_label (skip no-op updates)
+        self._last_app = None
+
+        # Last (text, fg) written to each dynamic status label
+        self._label_values = {}
+
+        # Last scheduler state snapshot rendered by _flush_ui, the newest one
+        # waiting to be rendered, and whether a _flush_ui is already posted
+        self._last_state: Optional[SchedulerState] = None
+        self._pending_state: Optional[SchedulerState] = None
+        self._ui_scheduled = False
+        # after() job for a same-phase redraw held back by UI_MIN_INTERVAL.
+        # Kept apart from _ui_scheduled so it never blocks a phase change.
+        self._ui_timer_job = None
+        self._last_ui_ts = 0.0  # time.monotonic() of the last redraw
+
+        # Log messages waiting to be written to log_text: (time, message).
+        # Producers on any thread append; the Tk thread drains every
+        # LOG_DRAIN_MS, or on show if the window was withdrawn. Only the Tk
+        # thread arms the drain - other threads _post() a request to arm it.
+        # Bounded like _log_history: a run spent hidden keeps only the newest
+        # messages instead of everything logged over hours.
+        self._tk_thread = threading.current_thread()
+        self._log_queue = collections.deque(maxlen=self.LOG_HISTORY_LINES)
+        # Root hidden with _hide_window() (automation running) - no log drains
+        self._withdrawn = False
+        self._log_drain_job = None
+        # A worker thread already posted _arm_log_drain (not yet run)
+        self._log_arm_posted = False
+        self._log_lines = 0  # Lines currently in log_text
+        # Formatted lines, including ones not yet shown because the user had
+        # scrolled up (_log_stale); the widget only keeps the newest tail
+        self._log_history = collections.deque(maxlen=self.LOG_HISTORY_LINES)
+        self._log_stale = False
+        # Newest log message and how many times in a row it arrived; repeats
+        # rewrite the last line as "message (xN)" instead of appending
+        self._last_log_msg: Optional[str] = None
+        self._last_log_count = 0
+        # "%H:%M:%S" stamp of the whole second _last_log_sec, reused for
+        # every message logged within that second
+        self._last_log_sec = -1
+        self._last_log_stamp = ""
+        # SchedulerState.action_seq of the last action sent to the log
+        self._last_logged_action_seq = 0
+
+        # Callbacks posted from scheduler/hotkey threads via _post(), run on
+        # the Tk thread when _UI_POSTED_EVENT arrives. _ui_wake_pending is
+        # set while an event is on its way, so a burst generates only one.
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_wake_pending = False
+
         # Build UI
         self._create_widgets()
+
+        # Widgets touched by _apply_privacy_mode, collected once
+        self._entry_widgets = (
+            self.active_min_entry,
+            self.active_max_entry,
+            self.idle_min_entry,
+            self.idle_max_entry,
+            self.app_switch_entry,
+            self.idle_keepalive_entry,
+            self.refresh_interval_entry,
+            self.total_runtime_entry,
+            self.shortcut_entry,
+            self.auto_lock_monitor_entry,
+        )
+        self._redacted_labels = (
+            (self.status_label, "🔒 HIDDEN"),
+            (self.timer_label, "--:--"),
+            (self.runtime_remaining_label, "--:--"),
+            (self.next_action_label, "--"),
+            (self.cycle_label, "--"),
+            (self.app_label, "Hidden"),
+        )
+        # Inputs locked by _set_settings_enabled while automation runs
+        self._toggleable_widgets = (
+            self.active_min_entry,
+            self.active_max_entry,
+            self.idle_min_entry,
+            self.idle_max_entry,
+            self.app_switch_entry,
+            self.idle_keepalive_entry,
+            self.refresh_checkbox,
+            self.total_runtime_entry,
+            self.repeat_checkbox,
+            self.shortcut_entry,
+            self.force_logout_checkbox,
+            self.simple_logout_checkbox,
+            self.auto_lock_checkbox,
+        )
         self._apply_privacy_mode()
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
-        
-        # Center window on screen
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() - self._window_width) // 2
-        y = (self.root.winfo_screenheight() - self._window_height) // 2
-        self.root.geometry(f"{self._window_width}x{self._window_height}+{x}+{y}")
 
-        # Block screen capture for this window (Windows 10+)
-        self._set_window_capture_protection()
+        # Drop the cached screen size whenever the root is mapped (shown
+        # again after a run, possibly on a changed display). Bound to a tag
+        # only the root carries - binding "." would run for every child too.
+        self.root.bindtags((self._ROOT_BINDTAG,) + self.root.bindtags())
+        self.root.bind_class(self._ROOT_BINDTAG, "<Map>", self._on_root_map)
+
+        # Run callbacks posted from worker threads - on demand, no polling
+        self.root.bind(self._UI_POSTED_EVENT, self._drain_ui_queue)
+
+        # Block screen capture for this window (Windows 10+). Deferred to idle
+        # so it runs after Tk has mapped the root and created its frame HWND.
+        self.root.after_idle(self._set_window_capture_protection)
         
         logger.info("AutoWebApp initialized")
 
+    def _post(self, callback) -> None:
+        """
+        Run a callback on the Tk thread (safe to call from any thread).
+
+        Args:
+            callback: Function taking no arguments
+        """
+        self._ui_queue.put(callback)
+        # Wake the Tk thread only when no wakeup is already on its way
+        if not self._ui_wake_pending:
+            self._ui_wake_pending = True
+            try:
+                self.root.event_generate(self._UI_POSTED_EVENT, when="tail")
+            except (tk.TclError, RuntimeError):
+                # Application already closed
+                pass
+
+    def _drain_ui_queue(self, event=None) -> None:
+        """Run all posted callbacks (bound to _UI_POSTED_EVENT)."""
+        # Cleared before draining: a callback posted from here on either is
+        # picked up below or generates a fresh event
+        self._ui_wake_pending = False
+        while True:
+            try:
+                callback = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception:
+                logger.exception("Error in UI callback")
+
+    def _on_root_map(self, event) -> None:
+        """Invalidate the cached screen size when the root window is shown."""
+        _screen_size.cache_clear()
+
     def _set_privacy_log_placeholder(self) -> None:
         """Show a placeholder in the log when privacy mode is enabled."""
-        placeholder = "Privacy Shield enabled. Logs hidden.\n"
-        self.log_text.configure(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
-        self.log_text.insert(tk.END, placeholder)
-        self.log_text.configure(state=tk.DISABLED)
+        if self._privacy_placeholder_set:
+            return
+        # One Tcl eval instead of four separate widget commands
+        w = self.log_text._w
+        self.log_text.tk.eval(
+            f"{w} configure -state normal; {w} delete 1.0 end; "
+            f"{w} insert end {{Privacy Shield enabled. Logs hidden.\n}}; "
+            f"{w} configure -state disabled"
+        )
+        self._log_lines = 1
+        self._last_log_msg = None
+        self._privacy_placeholder_set = True
 
     def _apply_privacy_mode(self) -> None:
         """Apply redaction settings across the UI."""
-        enabled = self.privacy_mode.get()
+        enabled = self._privacy_enabled
 
         # Keep inputs visible even when privacy mode is enabled
-        self.active_min_entry.configure(show="")
-        self.active_max_entry.configure(show="")
-        self.idle_min_entry.configure(show="")
-        self.idle_max_entry.configure(show="")
-        self.app_switch_entry.configure(show="")
-        self.idle_keepalive_entry.configure(show="")
-        self.refresh_interval_entry.configure(show="")
-        self.total_runtime_entry.configure(show="")
-        self.shortcut_entry.configure(show="")
-        self.auto_lock_monitor_entry.configure(show="")
+        for entry in self._entry_widgets:
+            entry.configure(show="")
 
         if enabled:
-            self.status_label.configure(text="🔒 HIDDEN", fg=Colors.TEXT_DIM)
-            self.timer_label.configure(text="--:--", fg=Colors.TEXT_DIM)
-            self.runtime_remaining_label.configure(text="--:--", fg=Colors.TEXT_DIM)
-            self.next_action_label.configure(text="--", fg=Colors.TEXT_DIM)
-            self.cycle_label.configure(text="--", fg=Colors.TEXT_DIM)
-            self.app_label.configure(text="Hidden", fg=Colors.TEXT_DIM)
+            for label, text in self._redacted_labels:
+                label.configure(text=text, fg=Colors.TEXT_DIM)
+            self._last_app = None
+            self._last_state = None
+            self._label_values.clear()
             self.idle_wait_label.configure(text="")
             self._set_privacy_log_placeholder()
         else:
+            # Log lines will be appended below the placeholder from here on
+            self._privacy_placeholder_set = False
             self._on_state_change(self.scheduler.state)
 
     def _on_privacy_toggle(self) -> None:
         """Handle privacy shield toggle."""
+        self._privacy_enabled = self.privacy_mode.get()
         self._apply_privacy_mode()
     
     def _set_window_transparency(self, alpha: int = 200):
@@ -418,13 +969,13 @@ class AutoWebApp:
             alpha: Transparency value (0=invisible, 255=opaque)
         """
         try:
-            hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+            hwnd = _GetParent(self.root.winfo_id())
             # Get current extended style
-            style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+            style = _GetWindowLongW(hwnd, GWL_EXSTYLE)
             # Add layered window style
-            ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_LAYERED)
+            _SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_LAYERED)
             # Set transparency
-            ctypes.windll.user32.SetLayeredWindowAttributes(hwnd, 0, alpha, LWA_ALPHA)
+            _SetLayeredWindowAttributes(hwnd, 0, alpha, LWA_ALPHA)
             logger.info(f"Window transparency set to {alpha}")
         except Exception as e:
             logger.error(f"Failed to set transparency: {e}")
@@ -434,48 +985,119 @@ class AutoWebApp:
         _apply_capture_protection(self.root, "main window")
     
     def _register_hotkey(self):
-        """Register Ctrl+Shift+Q global hotkey to stop automation."""
+        """
+        Register the global hotkeys on a single listener thread.
+
+        Ctrl+Shift+Q stops automation and closes the app; the configurable
+        pause/resume shortcut (default Ctrl+Shift+P) toggles pause.
+        """
+        pause_shortcut = self._get_pause_resume_shortcut()
+        if pause_shortcut == self._installed_pause_shortcut and \
+                self._hotkey_thread and self._hotkey_thread.is_alive():
+            # Same hotkeys already registered - skip the Unregister/Register round-trip
+            return
+        pause_modifiers, pause_vk = pause_shortcut
+
+        # The previous listener owns the hotkey IDs until it exits
+        self._unregister_hotkey()
+        previous = self._hotkey_thread
+        if previous is not None and not previous.is_alive():
+            previous = None
+        self._installed_pause_shortcut = pause_shortcut
+        # Fresh per listener - the previous one may still be winding down
+        # after a join timeout and must keep seeing its own event set
+        stop_event = threading.Event()
+        self._hotkey_stop_event = stop_event
+        self._hotkey_thread_id = None
+
         def hotkey_listener():
-            """Background thread to listen for Ctrl+Shift+Q hotkey."""
-            user32 = ctypes.windll.user32
+            """Background thread to listen for both global hotkeys."""
+            # Thread the message queue belongs to, for PostThreadMessageW
+            thread_id = _GetCurrentThreadId()
+            self._hotkey_thread_id = thread_id
+            registered = []
             
-            # Register the hotkey (Ctrl+Shift+Q)
-            if not user32.RegisterHotKey(None, self.HOTKEY_ID, MOD_CTRL | MOD_SHIFT, VK_Q):
-                logger.error("Failed to register Ctrl+Shift+Q hotkey")
-                return
+            # The previous listener outlived _unregister_hotkey's join and
+            # still holds the hotkey IDs - wait for it to unregister them
+            if previous is not None:
+                previous.join(self.HOTKEY_HANDOFF_TIMEOUT)
+                if stop_event.is_set():
+                    self._release_hotkey_thread_id(thread_id)
+                    return
             
-            logger.info("Ctrl+Shift+Q hotkey registered")
+            # Register the stop hotkey (Ctrl+Shift+Q)
+            if _RegisterHotKey(None, self.HOTKEY_ID, MOD_CTRL | MOD_SHIFT, VK_Q):
+                registered.append(self.HOTKEY_ID)
+                logger.info("Ctrl+Shift+Q hotkey registered")
+            else:
+                logger.error(
+                    f"Failed to register Ctrl+Shift+Q hotkey (error: {ctypes.get_last_error()})"
+                )
+                self._log_message("⚠️ Ctrl+Shift+Q hotkey unavailable - in use elsewhere?")
+            
+            # Register the pause/resume hotkey (MOD_NOREPEAT avoids repeat triggers)
+            if _RegisterHotKey(
+                None, GlobalHotkey.PAUSE_RESUME_ID, pause_modifiers | MOD_NOREPEAT, pause_vk
+            ):
+                registered.append(GlobalHotkey.PAUSE_RESUME_ID)
+                logger.info("Pause/Resume hotkey registered")
+            else:
+                logger.error(
+                    f"Failed to register pause/resume hotkey (error: {ctypes.get_last_error()})"
+                )
+                self._log_message(
+                    f"⚠️ Pause/Resume hotkey {format_shortcut(pause_modifiers, pause_vk)} "
+                    "unavailable - in use elsewhere?"
+                )
+            
+            if not registered:
+                self._release_hotkey_thread_id(thread_id)
+                return
             
             try:
                 msg = wintypes.MSG()
-                while not self._hotkey_stop_event.is_set():
-                    # Check for hotkey message with timeout
-                    if user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, 0x0001):
-                        if msg.message == 0x0312:  # WM_HOTKEY
-                            if msg.wParam == self.HOTKEY_ID:
-                                logger.info("Ctrl+Shift+Q hotkey pressed - stopping automation")
-                                # Stop automation from main thread
-                                self.root.after(0, self._on_hotkey_stop)
-                    else:
-                        # Sleep briefly to avoid high CPU usage
-                        import time
-                        time.sleep(0.1)
+                # GetMessageW blocks until a message arrives and returns 0 on
+                # WM_QUIT, which _unregister_hotkey posts to this thread
+                while not stop_event.is_set() and \
+                        _GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    if msg.message != WM_HOTKEY:
+                        continue
+                    if msg.wParam == self.HOTKEY_ID:
+                        logger.info("Ctrl+Shift+Q hotkey pressed - stopping automation")
+                        # Stop automation from main thread
+                        self._post(self._on_hotkey_stop)
+                    elif msg.wParam == GlobalHotkey.PAUSE_RESUME_ID:
+                        logger.info("Pause/Resume hotkey pressed")
+                        # Schedules itself on the main thread
+                        self._on_toggle_pause_resume()
             finally:
-                # Unregister the hotkey
-                user32.UnregisterHotKey(None, self.HOTKEY_ID)
-                logger.info("Ctrl+Shift+Q hotkey unregistered")
+                # Unregister the hotkeys
+                for hotkey_id in registered:
+                    _UnregisterHotKey(None, hotkey_id)
+                self._release_hotkey_thread_id(thread_id)
+                logger.info("Global hotkeys unregistered")
         
         # Start hotkey listener thread
-        self._hotkey_stop_event.clear()
-        self._hotkey_thread = threading.Thread(target=hotkey_listener, daemon=True)
+        self._hotkey_thread = threading.Thread(
+            target=hotkey_listener, name="GlobalHotkeys", daemon=True
+        )
         self._hotkey_thread.start()
     
     def _unregister_hotkey(self):
         """Stop the hotkey listener thread."""
+        self._installed_pause_shortcut = None
         if self._hotkey_thread and self._hotkey_thread.is_alive():
             self._hotkey_stop_event.set()
+            # Wake the listener out of GetMessageW
+            if self._hotkey_thread_id is not None:
+                _PostThreadMessageW(self._hotkey_thread_id, WM_QUIT, 0, 0)
             self._hotkey_thread.join(timeout=1.0)
     
+    def _release_hotkey_thread_id(self, thread_id: int) -> None:
+        """Forget a listener's thread id unless a newer listener replaced it."""
+        if self._hotkey_thread_id == thread_id:
+            self._hotkey_thread_id = None
+    
     def _on_hotkey_stop(self):
         """Handle Ctrl+Shift+Q hotkey press - stop and close app."""
         self._log_message("🔑 Ctrl+Shift+Q pressed - stopping and closing")
@@ -485,9 +1107,14 @@ class AutoWebApp:
         # Close the application
         self._on_close()
     
-    def _register_pause_resume_hotkey(self):
-        """Register the configurable pause/resume global hotkey."""
-        shortcut_str = self.shortcut_var.get().strip()
+    def _get_pause_resume_shortcut(self) -> Tuple[int, int]:
+        """
+        Resolve the configured pause/resume shortcut.
+
+        Returns:
+            Tuple of (modifiers, vk_code); Ctrl+Shift+P if the setting is invalid
+        """
+        shortcut_str = self.shortcut_entry.get().strip()
         result = GlobalHotkey.parse_shortcut(shortcut_str)
         
         if result[0] is None:
@@ -498,32 +1125,28 @@ class AutoWebApp:
         else:
             modifiers, vk_code = result
         
-        # Create and start the global hotkey
-        self._pause_resume_hotkey = GlobalHotkey(
-            on_toggle=self._on_toggle_pause_resume,
-            modifiers=modifiers,
-            vk_code=vk_code,
-            hotkey_id=GlobalHotkey.PAUSE_RESUME_ID
-        )
-        self._pause_resume_hotkey.start()
-        self._log_message(f"🔑 Pause/Resume hotkey: {self._pause_resume_hotkey.shortcut_name}")
+        # Only announce the shortcut when it differs from the last one logged
+        shortcut_name = format_shortcut(modifiers, vk_code)
+        if shortcut_name != self._last_shortcut_name:
+            self._last_shortcut_name = shortcut_name
+            self._log_message(f"🔑 Pause/Resume hotkey: {shortcut_name}")
+        return modifiers, vk_code
     
     def _on_toggle_pause_resume(self):
         """Handle global pause/resume hotkey press."""
         def do_toggle():
-            if self.scheduler.is_running():
-                is_now_paused = self.scheduler.toggle_pause()
-                if is_now_paused:
-                    self._log_message("⏸️ Automation PAUSED (hotkey)")
-                    # Hide window when paused
-                    self.root.withdraw()
-                else:
-                    self._log_message("▶️ Automation RESUMED (hotkey)")
-                    # Also hide window when resumed
-                    self.root.withdraw()
-        
-        # Schedule on main thread (tkinter thread safety)
-        self.root.after(0, do_toggle)
+            if not self.scheduler.is_running():
+                return
+            is_now_paused = self.scheduler.toggle_pause()
+            if is_now_paused:
+                self._log_message("⏸️ Automation PAUSED (hotkey)")
+            else:
+                self._log_message("▶️ Automation RESUMED (hotkey)")
+            # Keep the window hidden either way
+            self._hide_window()
+        
+        # Run on main thread (tkinter thread safety)
+        self._post(do_toggle)
     
     def _on_auto_lock_toggle(self):
         """Handle auto lock checkbox toggle - enable/disable monitoring time input."""
@@ -546,23 +1169,14 @@ class AutoWebApp:
         elif self.simple_logout_var.get():
             # Simple logout - close app and lock screen (Win+L)
             self._log_message("🚪 User activity detected - Simple logout: Closing app and locking screen")
-            self.root.after(0, self._perform_simple_logout)
+            self._post(self._perform_simple_logout)
     
     def _before_force_logout(self):
         """Cleanup before OS force logout - stop all timers, remove hooks."""
         logger.warning("FORCE LOGOUT: Running pre-logout cleanup...")
         
-        # Stop all timers and automation
-        if self.scheduler.is_running():
-            self.scheduler.stop()
-        
-        # Unregister all hotkeys
-        self._unregister_hotkey()
-        if self._pause_resume_hotkey:
-            self._pause_resume_hotkey.stop()
-        
-        # Disable force logout to prevent recursion
-        self.force_logout_handler.enabled = False
+        # Stop automation, unregister hotkeys, disable force logout (prevents recursion)
+        self._release_resources()
         
         logger.warning("FORCE LOGOUT: Cleanup complete, proceeding with OS logout")
     
@@ -576,18 +1190,17 @@ class AutoWebApp:
             
             # Then lock the Windows screen (Win+L)
             # This keeps other apps running but locks the screen
-            ctypes.windll.user32.LockWorkStation()
+            _LockWorkStation()
             
         except Exception as e:
             logger.error(f"Failed to perform simple logout: {e}")
             # If locking fails, still close the app
-            import sys
             sys.exit(0)
     
     def _create_widgets(self) -> None:
         """Create all UI widgets."""
         # Scrollable main container for smaller screens
-        outer = tk.Frame(self.root, bg=Colors.BACKGROUND)
+        outer = ttk.Frame(self.root, style="Background.TFrame")
         outer.pack(fill=tk.BOTH, expand=True)
 
         self._main_canvas = tk.Canvas(
@@ -602,7 +1215,7 @@ class AutoWebApp:
         v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self._main_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        self._scroll_content = tk.Frame(self._main_canvas, bg=Colors.BACKGROUND)
+        self._scroll_content = ttk.Frame(self._main_canvas, style="Background.TFrame")
         self._scroll_window_id = self._main_canvas.create_window(
             (0, 0), window=self._scroll_content, anchor="nw"
         )
@@ -618,7 +1231,7 @@ class AutoWebApp:
         self.root.bind_all("<MouseWheel>", self._on_mousewheel)
 
         # Main content frame inside scroll container
-        main_frame = tk.Frame(self._scroll_content, bg=Colors.BACKGROUND)
+        main_frame = ttk.Frame(self._scroll_content, style="Background.TFrame")
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Header
@@ -649,7 +1262,7 @@ class AutoWebApp:
     
     def _create_header(self, parent: tk.Frame) -> None:
         """Create the header section."""
-        header_frame = tk.Frame(parent, bg=Colors.BACKGROUND)
+        header_frame = ttk.Frame(parent, style="Background.TFrame")
         header_frame.pack(fill=tk.X, pady=(0, 15))
         
         # App title
@@ -672,7 +1285,7 @@ class AutoWebApp:
         )
         subtitle_label.pack(anchor=tk.W)
 
-        privacy_frame = tk.Frame(header_frame, bg=Colors.BACKGROUND)
+        privacy_frame = ttk.Frame(header_frame, style="Background.TFrame")
         privacy_frame.pack(anchor=tk.W, pady=(8, 0))
 
         privacy_toggle = tk.Checkbutton(
@@ -692,17 +1305,17 @@ class AutoWebApp:
     def _create_submit_button(self, parent: tk.Frame) -> None:
         """Create the big SUBMIT button."""
         # Submit button frame
-        submit_frame = tk.Frame(parent, bg=Colors.BACKGROUND)
+        submit_frame = ttk.Frame(parent, style="Background.TFrame")
         submit_frame.pack(fill=tk.X, pady=(10, 10))
         
         self.submit_btn = tk.Button(
             submit_frame,
             text="✓ SUBMIT",
             command=self._on_submit,
-            font=("Segoe UI", 16, "bold"),
+            font=Fonts.TITLE,
             bg=Colors.SUCCESS,
             fg=Colors.BACKGROUND,
-            activebackground="#8bc78f",
+            activebackground=Colors.SUCCESS_ACTIVE,
             padx=50,
             pady=15,
             cursor="hand2",
@@ -726,273 +1339,41 @@ class AutoWebApp:
     
     def _create_settings_panel(self, parent: tk.Frame) -> None:
         """Create the settings panel for timing configuration."""
+        # Palette and fonts shared by most widgets below, looked up once
+        surface, text, text_dim = Colors.SURFACE, Colors.TEXT, Colors.TEXT_DIM
+        background, body, note = Colors.BACKGROUND, Fonts.BODY, Fonts.NOTE
+        
         # Settings frame
-        settings_frame = tk.Frame(parent, bg=Colors.SURFACE, padx=15, pady=15)
+        settings_frame = tk.Frame(parent, bg=surface, padx=15, pady=15)
         settings_frame.pack(fill=tk.X, pady=(0, 10))
+        # Two-column grid: each setting is a column frame in one grid, so the
+        # whole panel is laid out by a single geometry manager solve
+        settings_frame.columnconfigure((0, 1), weight=1)
         
         # Settings title
         settings_title = tk.Label(
             settings_frame,
             text="⚙️ Timing Settings",
             font=Fonts.HEADING,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT
-        )
-        settings_title.pack(anchor=tk.W, pady=(0, 10))
-        
-        # First row: Active (clicking) duration range
-        row1 = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        row1.pack(fill=tk.X, pady=(0, 10))
-        
-        active_min_frame = tk.Frame(row1, bg=Colors.SURFACE)
-        active_min_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-        
-        active_min_label = tk.Label(
-            active_min_frame,
-            text="▶️ Active Min (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        active_min_label.pack(anchor=tk.W)
-        
-        self.active_min_var = tk.StringVar(value=self._format_time(self.DEFAULT_ACTIVE_MIN_SEC))
-        self.active_min_entry = tk.Entry(
-            active_min_frame,
-            textvariable=self.active_min_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT
-        )
-        self.active_min_entry.pack(anchor=tk.W, pady=(3, 0))
-        
-        active_min_note = tk.Label(
-            active_min_frame,
-            text="Minimum active time",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        active_min_note.pack(anchor=tk.W)
-        
-        active_max_frame = tk.Frame(row1, bg=Colors.SURFACE)
-        active_max_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        active_max_label = tk.Label(
-            active_max_frame,
-            text="▶️ Active Max (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        active_max_label.pack(anchor=tk.W)
-        
-        self.active_max_var = tk.StringVar(value=self._format_time(self.DEFAULT_ACTIVE_MAX_SEC))
-        self.active_max_entry = tk.Entry(
-            active_max_frame,
-            textvariable=self.active_max_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT
-        )
-        self.active_max_entry.pack(anchor=tk.W, pady=(3, 0))
-        
-        active_max_note = tk.Label(
-            active_max_frame,
-            text="Maximum active time",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        active_max_note.pack(anchor=tk.W)
-        
-        # Second row: Pause duration range
-        row2 = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        row2.pack(fill=tk.X, pady=(0, 10))
-        
-        idle_min_frame = tk.Frame(row2, bg=Colors.SURFACE)
-        idle_min_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-        
-        idle_min_label = tk.Label(
-            idle_min_frame,
-            text="⏸️ Pause Min (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        idle_min_label.pack(anchor=tk.W)
-        
-        self.idle_min_var = tk.StringVar(value=self._format_time(self.DEFAULT_IDLE_MIN_SEC))
-        self.idle_min_entry = tk.Entry(
-            idle_min_frame,
-            textvariable=self.idle_min_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT
-        )
-        self.idle_min_entry.pack(anchor=tk.W, pady=(3, 0))
-        
-        idle_min_note = tk.Label(
-            idle_min_frame,
-            text="Minimum pause time",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        idle_min_note.pack(anchor=tk.W)
-        
-        idle_max_frame = tk.Frame(row2, bg=Colors.SURFACE)
-        idle_max_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        idle_max_label = tk.Label(
-            idle_max_frame,
-            text="⏸️ Pause Max (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        idle_max_label.pack(anchor=tk.W)
-        
-        self.idle_max_var = tk.StringVar(value=self._format_time(self.DEFAULT_IDLE_MAX_SEC))
-        self.idle_max_entry = tk.Entry(
-            idle_max_frame,
-            textvariable=self.idle_max_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT
-        )
-        self.idle_max_entry.pack(anchor=tk.W, pady=(3, 0))
-        
-        idle_max_note = tk.Label(
-            idle_max_frame,
-            text="Maximum pause time",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        idle_max_note.pack(anchor=tk.W)
-        
-        # Third row: App switch interval and total runtime
-        row3 = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        row3.pack(fill=tk.X, pady=(0, 10))
-        
-        app_switch_frame = tk.Frame(row3, bg=Colors.SURFACE)
-        app_switch_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-        
-        app_switch_label = tk.Label(
-            app_switch_frame,
-            text="🔄 App Switch (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
+            bg=surface,
+            fg=text
         )
-        app_switch_label.pack(anchor=tk.W)
+        settings_title.grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 10))
         
-        self.app_switch_var = tk.StringVar(value=self._format_time(self.DEFAULT_APP_SWITCH_SEC))
-        self.app_switch_entry = tk.Entry(
-            app_switch_frame,
-            textvariable=self.app_switch_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT
-        )
-        self.app_switch_entry.pack(anchor=tk.W, pady=(3, 0))
-        
-        app_switch_note = tk.Label(
-            app_switch_frame,
-            text="Time between screen changes",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        app_switch_note.pack(anchor=tk.W)
-        
-        runtime_frame = tk.Frame(row3, bg=Colors.SURFACE)
-        runtime_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        runtime_label = tk.Label(
-            runtime_frame,
-            text="⏱️ Total Runtime (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        runtime_label.pack(anchor=tk.W)
-        
-        self.total_runtime_var = tk.StringVar(value=self._format_time(self.DEFAULT_RUNTIME_SEC))
-        self.total_runtime_entry = tk.Entry(
-            runtime_frame,
-            textvariable=self.total_runtime_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT
-        )
-        self.total_runtime_entry.pack(anchor=tk.W, pady=(3, 0))
-        
-        runtime_note = tk.Label(
-            runtime_frame,
-            text="App auto-closes when done",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        runtime_note.pack(anchor=tk.W)
+        # First three rows: paired duration settings (active range, pause
+        # range, app switch + total runtime)
+        columns = []
+        for row, row_spec in enumerate(self._TIME_SETTING_ROWS, start=1):
+            for index, spec in enumerate(row_spec):
+                column = self._settings_cell(settings_frame, row, index)
+                self._make_time_entry(column, *spec)
+                columns.append(column)
 
-        keepalive_label = tk.Label(
-            runtime_frame,
-            text="Idle Keepalive (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        keepalive_label.pack(anchor=tk.W, pady=(8, 0))
-
-        self.idle_keepalive_var = tk.StringVar(value=self._format_time(self.DEFAULT_IDLE_KEEPALIVE_SEC))
-        self.idle_keepalive_entry = tk.Entry(
-            runtime_frame,
-            textvariable=self.idle_keepalive_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT
-        )
-        self.idle_keepalive_entry.pack(anchor=tk.W, pady=(3, 0))
-
-        keepalive_note = tk.Label(
-            runtime_frame,
-            text="Heartbeat during pause (00:00 disables)",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        keepalive_note.pack(anchor=tk.W)
+        # Idle keepalive stacks under Total Runtime
+        self._make_time_entry(columns[-1], *self._KEEPALIVE_SETTING, label_pady=(8, 0))
 
         # Fourth row: Refresh feature (optional periodic F5)
-        row4 = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        row4.pack(fill=tk.X, pady=(0, 10))
-
-        refresh_frame = tk.Frame(row4, bg=Colors.SURFACE)
-        refresh_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        refresh_frame = self._settings_cell(settings_frame, 4, 0)
 
         self.refresh_var = tk.BooleanVar(value=False)
         self.refresh_checkbox = tk.Checkbutton(
@@ -1000,12 +1381,12 @@ class AutoWebApp:
             text="Refresh current app automatically",
             variable=self.refresh_var,
             command=self._on_refresh_toggle,
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT,
-            activebackground=Colors.SURFACE,
-            activeforeground=Colors.TEXT,
-            selectcolor=Colors.SURFACE,
+            font=body,
+            bg=surface,
+            fg=text,
+            activebackground=surface,
+            activeforeground=text,
+            selectcolor=surface,
             justify=tk.LEFT
         )
         self.refresh_checkbox.pack(anchor=tk.W)
@@ -1013,54 +1394,19 @@ class AutoWebApp:
         refresh_note = tk.Label(
             refresh_frame,
             text="Sends F5 to the focused app at the interval below",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
+            font=note,
+            bg=surface,
+            fg=text_dim
         )
         refresh_note.pack(anchor=tk.W)
 
-        refresh_time_frame = tk.Frame(row4, bg=Colors.SURFACE)
-        refresh_time_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-        refresh_time_label = tk.Label(
-            refresh_time_frame,
-            text="Refresh Interval (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        refresh_time_label.pack(anchor=tk.W)
+        refresh_time_frame = self._settings_cell(settings_frame, 4, 1)
 
-        self.refresh_interval_var = tk.StringVar(value=self._format_time(self.DEFAULT_REFRESH_INTERVAL_SEC))
-        self.refresh_interval_entry = tk.Entry(
-            refresh_time_frame,
-            textvariable=self.refresh_interval_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT,
-            state=tk.DISABLED
-        )
-        self.refresh_interval_entry.pack(anchor=tk.W, pady=(3, 0))
-
-        refresh_time_note = tk.Label(
-            refresh_time_frame,
-            text="Used only when Refresh is checked",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        refresh_time_note.pack(anchor=tk.W)
+        self._make_time_entry(refresh_time_frame, *self._REFRESH_INTERVAL_SETTING, state=tk.DISABLED)
         
         # Fifth row: Auto Lock feature (Conditional Win+L after monitoring time)
-        row5 = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        row5.pack(fill=tk.X, pady=(0, 10))
-        
         # Auto Lock checkbox
-        auto_lock_frame = tk.Frame(row5, bg=Colors.SURFACE)
-        auto_lock_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        auto_lock_frame = self._settings_cell(settings_frame, 5, 0)
         
         self.auto_lock_var = tk.BooleanVar(value=False)
         self.auto_lock_checkbox = tk.Checkbutton(
@@ -1068,12 +1414,12 @@ class AutoWebApp:
             text="🔐 Enable Auto Lock After Monitoring",
             variable=self.auto_lock_var,
             command=self._on_auto_lock_toggle,
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
+            font=body,
+            bg=surface,
             fg=Colors.WARNING,
-            activebackground=Colors.SURFACE,
+            activebackground=surface,
             activeforeground=Colors.WARNING,
-            selectcolor=Colors.SURFACE,
+            selectcolor=surface,
             justify=tk.LEFT
         )
         self.auto_lock_checkbox.pack(anchor=tk.W)
@@ -1081,100 +1427,64 @@ class AutoWebApp:
         auto_lock_note = tk.Label(
             auto_lock_frame,
             text="Lock screen (Win+L) if user activity detected",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
+            font=note,
+            bg=surface,
+            fg=text_dim
         )
         auto_lock_note.pack(anchor=tk.W)
         
         # Monitoring start time input
-        auto_lock_time_frame = tk.Frame(row5, bg=Colors.SURFACE)
-        auto_lock_time_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        auto_lock_time_label = tk.Label(
-            auto_lock_time_frame,
-            text="⏱️ Monitoring Start (mm:ss):",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        auto_lock_time_label.pack(anchor=tk.W)
+        auto_lock_time_frame = self._settings_cell(settings_frame, 5, 1)
         
-        self.auto_lock_monitor_var = tk.StringVar(value=self._format_time(self.DEFAULT_AUTO_LOCK_MONITOR_SEC))
-        self.auto_lock_monitor_entry = tk.Entry(
-            auto_lock_time_frame,
-            textvariable=self.auto_lock_monitor_var,
-            font=Fonts.BODY,
-            width=8,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
-            relief=tk.FLAT,
-            state=tk.DISABLED  # Disabled by default until checkbox is checked
-        )
-        self.auto_lock_monitor_entry.pack(anchor=tk.W, pady=(3, 0))
-        
-        auto_lock_time_note = tk.Label(
-            auto_lock_time_frame,
-            text="Time before monitoring begins",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
-        )
-        auto_lock_time_note.pack(anchor=tk.W)
+        # Disabled by default until checkbox is checked
+        self._make_time_entry(auto_lock_time_frame, *self._AUTO_LOCK_MONITOR_SETTING, state=tk.DISABLED)
         
         # Sixth row: Global shortcut + Force logout
-        row6 = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        row6.pack(fill=tk.X, pady=(0, 10))
-        
-        shortcut_config_frame = tk.Frame(row6, bg=Colors.SURFACE)
-        shortcut_config_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        shortcut_config_frame = self._settings_cell(settings_frame, 6, 0)
         
         shortcut_config_label = tk.Label(
             shortcut_config_frame,
             text="🔑 Pause/Resume Shortcut:",
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
+            font=body,
+            bg=surface,
+            fg=text_dim
         )
         shortcut_config_label.pack(anchor=tk.W)
         
-        self.shortcut_var = tk.StringVar(value="Ctrl+Shift+P")
         self.shortcut_entry = tk.Entry(
             shortcut_config_frame,
-            textvariable=self.shortcut_var,
-            font=Fonts.BODY,
+            font=body,
             width=16,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
-            insertbackground=Colors.TEXT,
+            bg=background,
+            fg=text,
+            insertbackground=text,
             relief=tk.FLAT
         )
+        self.shortcut_entry.insert(0, "Ctrl+Shift+P")
         self.shortcut_entry.pack(anchor=tk.W, pady=(3, 0))
         
         shortcut_config_note = tk.Label(
             shortcut_config_frame,
             text="Global hotkey (e.g. Ctrl+Shift+P)",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
+            font=note,
+            bg=surface,
+            fg=text_dim
         )
         shortcut_config_note.pack(anchor=tk.W)
         
         # Force logout checkbox
-        force_logout_frame = tk.Frame(row6, bg=Colors.SURFACE)
-        force_logout_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        force_logout_frame = self._settings_cell(settings_frame, 6, 1)
         
         self.force_logout_checkbox = tk.Checkbutton(
             force_logout_frame,
             text="⚠️ Force OS Logout\non User Activity",
             variable=self.force_logout_var,
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
+            font=body,
+            bg=surface,
             fg=Colors.ERROR,
-            activebackground=Colors.SURFACE,
+            activebackground=surface,
             activeforeground=Colors.ERROR,
-            selectcolor=Colors.SURFACE,
+            selectcolor=surface,
             justify=tk.LEFT
         )
         self.force_logout_checkbox.pack(anchor=tk.W, pady=(10, 0))
@@ -1182,30 +1492,26 @@ class AutoWebApp:
         force_logout_note = tk.Label(
             force_logout_frame,
             text="WARNING: Logs out Windows OS!",
-            font=("Segoe UI", 8, "bold"),
-            bg=Colors.SURFACE,
+            font=Fonts.NOTE_BOLD,
+            bg=surface,
             fg=Colors.ERROR
         )
         force_logout_note.pack(anchor=tk.W)
         
-        # Add seventh row for simple logout
-        row7 = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        row7.pack(fill=tk.X, pady=(10, 0))
-        
-        # Simple logout checkbox (app-only close)
-        simple_logout_frame = tk.Frame(row7, bg=Colors.SURFACE)
-        simple_logout_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        # Seventh row: simple logout checkbox (app-only close), full width
+        simple_logout_frame = ttk.Frame(settings_frame, style="Surface.TFrame")
+        simple_logout_frame.grid(row=7, column=0, columnspan=2, sticky=tk.EW, pady=(10, 0))
         
         self.simple_logout_checkbox = tk.Checkbutton(
             simple_logout_frame,
             text="🚪 Simple Logout\n(Logout Windows + Stop App)",
             variable=self.simple_logout_var,
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
+            font=body,
+            bg=surface,
             fg=Colors.WARNING,
-            activebackground=Colors.SURFACE,
+            activebackground=surface,
             activeforeground=Colors.WARNING,
-            selectcolor=Colors.SURFACE,
+            selectcolor=surface,
             justify=tk.LEFT
         )
         self.simple_logout_checkbox.pack(anchor=tk.W, pady=(10, 0))
@@ -1213,27 +1519,27 @@ class AutoWebApp:
         simple_logout_note = tk.Label(
             simple_logout_frame,
             text="Logs out Windows system and stops AutoWeb",
-            font=("Segoe UI", 8),
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT_DIM
+            font=note,
+            bg=surface,
+            fg=text_dim
         )
         simple_logout_note.pack(anchor=tk.W)
         
         # Reset defaults button
-        reset_frame = tk.Frame(settings_frame, bg=Colors.SURFACE)
-        reset_frame.pack(fill=tk.X, pady=(5, 0))
+        reset_frame = ttk.Frame(settings_frame, style="Surface.TFrame")
+        reset_frame.grid(row=8, column=0, columnspan=2, sticky=tk.EW, pady=(5, 0))
         
         self.repeat_screens_var = tk.BooleanVar(value=True)
         self.repeat_checkbox = tk.Checkbutton(
             reset_frame,
             text="Repeat Screen View",
             variable=self.repeat_screens_var,
-            font=Fonts.BODY,
-            bg=Colors.SURFACE,
-            fg=Colors.TEXT,
-            activebackground=Colors.SURFACE,
-            activeforeground=Colors.TEXT,
-            selectcolor=Colors.SURFACE
+            font=body,
+            bg=surface,
+            fg=text,
+            activebackground=surface,
+            activeforeground=text,
+            selectcolor=surface
         )
         self.repeat_checkbox.pack(side=tk.LEFT)
 
@@ -1241,9 +1547,9 @@ class AutoWebApp:
             reset_frame,
             text="Reset Defaults",
             command=self._reset_defaults,
-            font=Fonts.BODY,
-            bg=Colors.BACKGROUND,
-            fg=Colors.TEXT,
+            font=body,
+            bg=background,
+            fg=text,
             relief=tk.FLAT,
             cursor="hand2"
         )
@@ -1253,12 +1559,97 @@ class AutoWebApp:
         tip_label = tk.Label(
             settings_frame,
             text="💡 Use mm:ss. Active and pause ranges are randomized each cycle.",
-            font=("Segoe UI", 9),
+            font=Fonts.TIP,
+            bg=surface,
+            fg=text_dim
+        )
+        tip_label.grid(row=9, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+
+    @staticmethod
+    def _settings_cell(settings_frame: tk.Frame, row: int, column: int) -> ttk.Frame:
+        """
+        Create one half-width cell of the settings grid.
+
+        Args:
+            settings_frame: Settings panel frame
+            row: Grid row
+            column: 0 (left, padded from the right cell) or 1 (right)
+
+        Returns:
+            The cell frame; its contents are packed vertically
+        """
+        cell = ttk.Frame(settings_frame, style="Surface.TFrame")
+        cell.grid(
+            row=row,
+            column=column,
+            sticky=tk.EW,
+            padx=(0, 10) if column == 0 else 0,
+            pady=(0, 10)
+        )
+        return cell
+
+    def _make_time_entry(
+        self,
+        parent: tk.Misc,
+        name: str,
+        label: str,
+        default_text: str,
+        note: str,
+        state: str = tk.NORMAL,
+        label_pady=0
+    ) -> tk.Entry:
+        """
+        Create a labelled mm:ss entry with a note underneath.
+
+        The Entry is stored as ``<name>_entry``; its value is read directly
+        on submit, so no StringVar is attached.
+
+        Args:
+            parent: Frame to pack the widgets into
+            name: Attribute name prefix
+            label: Label text above the entry
+            default_text: Initial mm:ss value
+            note: Hint text below the entry
+            state: Initial entry state
+            label_pady: Vertical padding of the label
+
+        Returns:
+            The created Entry
+        """
+        tk.Label(
+            parent,
+            text=label,
+            font=Fonts.BODY,
             bg=Colors.SURFACE,
             fg=Colors.TEXT_DIM
+        ).pack(anchor=tk.W, pady=label_pady)
+        
+        entry = tk.Entry(
+            parent,
+            font=Fonts.BODY,
+            width=8,
+            bg=Colors.BACKGROUND,
+            fg=Colors.TEXT,
+            insertbackground=Colors.TEXT,
+            relief=tk.FLAT
         )
-        tip_label.pack(anchor=tk.W, pady=(5, 0))
-
+        # Fill in the default before disabling - a disabled Entry ignores insert
+        entry.insert(0, default_text)
+        if state != tk.NORMAL:
+            entry.configure(state=state)
+        entry.pack(anchor=tk.W, pady=(3, 0))
+        
+        tk.Label(
+            parent,
+            text=note,
+            font=Fonts.NOTE,
+            bg=Colors.SURFACE,
+            fg=Colors.TEXT_DIM
+        ).pack(anchor=tk.W)
+        
+        setattr(self, f"{name}_entry", entry)
+        return entry
+    
     def _create_status_card(self, parent: tk.Frame) -> None:
         """Create the main status display card."""
         # Status card frame
@@ -1301,7 +1692,7 @@ class AutoWebApp:
         time_desc_label.pack()
         
         # Runtime remaining section
-        runtime_frame = tk.Frame(status_card, bg=Colors.SURFACE)
+        runtime_frame = ttk.Frame(status_card, style="Surface.TFrame")
         runtime_frame.pack(fill=tk.X, pady=(10, 0))
         
         runtime_title = tk.Label(
@@ -1315,15 +1706,15 @@ class AutoWebApp:
         
         self.runtime_remaining_label = tk.Label(
             runtime_frame,
-            text=self._format_time(self.DEFAULT_RUNTIME_SEC),
-            font=("Segoe UI", 14, "bold"),
+            text=self._DEFAULT_RUNTIME_TEXT,
+            font=Fonts.STATUS,
             bg=Colors.SURFACE,
             fg=Colors.PRIMARY
         )
         self.runtime_remaining_label.pack(side=tk.LEFT, padx=10)
         
         # Idle wait indicator (shows when paused due to user activity)
-        self.idle_wait_frame = tk.Frame(status_card, bg=Colors.SURFACE)
+        self.idle_wait_frame = ttk.Frame(status_card, style="Surface.TFrame")
         self.idle_wait_frame.pack(fill=tk.X, pady=(5, 0))
         
         self.idle_wait_label = tk.Label(
@@ -1340,7 +1731,7 @@ class AutoWebApp:
         separator.pack(fill=tk.X, pady=15)
         
         # Next action timer section
-        next_action_frame = tk.Frame(status_card, bg=Colors.SURFACE)
+        next_action_frame = ttk.Frame(status_card, style="Surface.TFrame")
         next_action_frame.pack(fill=tk.X)
         
         next_action_title = tk.Label(
@@ -1355,7 +1746,7 @@ class AutoWebApp:
         self.next_action_label = tk.Label(
             next_action_frame,
             text="--",
-            font=("Segoe UI", 16, "bold"),
+            font=Fonts.TITLE,
             bg=Colors.SURFACE,
             fg=Colors.PRIMARY
         )
@@ -1372,7 +1763,7 @@ class AutoWebApp:
     
     def _create_info_cards(self, parent: tk.Frame) -> None:
         """Create the info cards row (cycle count, current app)."""
-        info_frame = tk.Frame(parent, bg=Colors.BACKGROUND)
+        info_frame = ttk.Frame(parent, style="Background.TFrame")
         info_frame.pack(fill=tk.X, pady=10)
         
         # Cycle count card
@@ -1391,7 +1782,7 @@ class AutoWebApp:
         self.cycle_label = tk.Label(
             cycle_card,
             text="0",
-            font=("Segoe UI", 24, "bold"),
+            font=Fonts.COUNTER,
             bg=Colors.SURFACE,
             fg=Colors.TEXT
         )
@@ -1423,11 +1814,11 @@ class AutoWebApp:
     
     def _create_activity_log(self, parent: tk.Frame) -> None:
         """Create the activity log section."""
-        log_frame = tk.Frame(parent, bg=Colors.BACKGROUND)
+        log_frame = ttk.Frame(parent, style="Background.TFrame")
         log_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
         # Log header
-        log_header = tk.Frame(log_frame, bg=Colors.BACKGROUND)
+        log_header = ttk.Frame(log_frame, style="Background.TFrame")
         log_header.pack(fill=tk.X)
         
         log_title = tk.Label(
@@ -1472,26 +1863,122 @@ class AutoWebApp:
         Args:
             message: Message to log
         """
-        if self.privacy_mode.get():
-            self._set_privacy_log_placeholder()
+        # The privacy placeholder is already shown - drop the message
+        if self._privacy_enabled:
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted = f"[{timestamp}] {message}\n"
+        self._log_queue.append((time.time(), message))
+        if threading.current_thread() is self._tk_thread:
+            self._schedule_log_drain()
+        # Worker thread: ask the Tk thread to arm the drain, once per batch.
+        # Not while hidden - _show_window drains everything anyway.
+        elif not self._withdrawn and not self._log_arm_posted:
+            self._log_arm_posted = True
+            self._post(self._arm_log_drain)
+
+    def _arm_log_drain(self) -> None:
+        """Arm the log drain on behalf of a worker thread (posted by _log_message)."""
+        self._log_arm_posted = False
+        self._schedule_log_drain()
+
+    def _schedule_log_drain(self) -> None:
+        """Arm _drain_log_queue unless it is armed already (Tk thread only)."""
+        # Window is hidden during automation - defer all Tk work until shown
+        if self._log_drain_job is None and not self._withdrawn:
+            self._log_drain_job = self.root.after(self.LOG_DRAIN_MS, self._drain_log_queue)
+
+    def _drain_log_queue(self) -> None:
+        """Write all queued log messages to log_text in one update."""
+        if self._log_drain_job is not None:
+            self.root.after_cancel(self._log_drain_job)
+            self._log_drain_job = None
+        # Hidden - leave the messages queued for _show_window
+        if self._withdrawn:
+            return
+        pending = []
+        popleft = self._log_queue.popleft
+        try:
+            while True:
+                pending.append(popleft())
+        except IndexError:
+            pass
+        if not pending or self._privacy_enabled:
+            return
+
+        # replace_last: lines[0] rewrites the line already shown
+        entries, replace_last, self._last_log_msg, self._last_log_count = _collapse_repeats(
+            pending, self._last_log_msg, self._last_log_count
+        )
+        lines = []
+        for ts, message, count in entries:
+            sec = int(ts)
+            if sec != self._last_log_sec:
+                self._last_log_sec = sec
+                self._last_log_stamp = time.strftime("%H:%M:%S", time.localtime(sec))
+            if count > 1:
+                lines.append(f"[{self._last_log_stamp}] {message} (x{count})\n")
+            else:
+                lines.append(f"[{self._last_log_stamp}] {message}\n")
+        if replace_last and self._log_history:
+            self._log_history.pop()
+        self._log_history.extend(lines)
+
+        # User scrolled up to read - leave the view alone until the next
+        # drain that finds it back at the bottom
+        if self.log_text.yview()[1] < 1.0:
+            self._log_stale = True
+            return
+
+        # A backlog (e.g. from a hidden run) longer than the widget keeps is
+        # written as one replace of the tail rather than insert-then-trim
+        if len(lines) >= self.LOG_KEEP_LINES:
+            self._log_stale = True
 
         self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, formatted)
+        if self._log_stale:
+            # Catch up in one replace with just the tail the widget keeps
+            tail = list(self._log_history)[-self.LOG_KEEP_LINES:]
+            self.log_text.delete(1.0, tk.END)
+            self.log_text.insert(tk.END, "".join(tail))
+            self._log_lines = len(tail)
+            self._log_stale = False
+        else:
+            if replace_last:
+                self.log_text.delete("end-2l", "end-1l")
+                self._log_lines -= 1
+            self.log_text.insert(tk.END, "".join(lines))
+            # Counted here rather than asking Tk for the end index on every drain
+            self._log_lines += len(lines)
+            if self._log_lines > self.LOG_MAX_LINES:
+                excess = self._log_lines - self.LOG_KEEP_LINES
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+                self._log_lines = self.LOG_KEEP_LINES
         self.log_text.see(tk.END)  # Scroll to bottom
         self.log_text.configure(state=tk.DISABLED)
     
+    def _hide_window(self) -> None:
+        """Withdraw the root window; log drains wait until it is shown."""
+        self._withdrawn = True
+        self.root.withdraw()
+
+    def _show_window(self) -> None:
+        """Re-show the root window and write the log backlog in one pass."""
+        self._withdrawn = False
+        self.root.deiconify()
+        self._drain_log_queue()
+
     def _clear_log(self) -> None:
         """Clear the activity log."""
-        if self.privacy_mode.get():
+        if self._privacy_enabled:
             self._set_privacy_log_placeholder()
             return
         self.log_text.configure(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.configure(state=tk.DISABLED)
+        self._log_lines = 0
+        self._log_history.clear()
+        self._log_stale = False
+        self._last_log_msg = None
     
     def _format_time(self, seconds: int) -> str:
         """
@@ -1503,142 +1990,197 @@ class AutoWebApp:
         Returns:
             Formatted time string
         """
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes:02d}:{secs:02d}"
+        return _format_mmss(seconds)
     
     def _on_state_change(self, state: SchedulerState) -> None:
         """
         Callback when scheduler state changes.
         
         Updates the UI to reflect the new state.
-        This is called from the scheduler thread, so we use
-        root.after() to safely update the UI.
+        This is called from the scheduler thread, so the update is
+        posted to the Tk thread with _post().
         
         Args:
             state: New scheduler state
         """
-        def update_ui():
-            if self.privacy_mode.get():
-                self._apply_privacy_mode()
-                return
-            # Update status label
-            if state.phase == AutomationPhase.ACTIVE:
-                self.status_label.configure(
-                    text="▶️ ACTIVE",
-                    fg=Colors.SUCCESS
-                )
-            elif state.phase == AutomationPhase.IDLE:
-                self.status_label.configure(
-                    text="💤 IDLE",
-                    fg=Colors.WARNING
-                )
-            elif state.phase == AutomationPhase.WAITING_IDLE:
-                self.status_label.configure(
-                    text="⏸️ PAUSED",
-                    fg=Colors.WARNING
-                )
-            elif state.phase == AutomationPhase.PAUSED:
-                self.status_label.configure(
-                    text="⏸️ PAUSED",
-                    fg=Colors.WARNING
-                )
-            else:
-                self.status_label.configure(
-                    text="⏹️ STOPPED",
-                    fg=Colors.ERROR
-                )
-            
-            # Update timer
-            self.timer_label.configure(
-                text=self._format_time(state.time_remaining)
-            )
-            
-            # Update runtime remaining
-            self.runtime_remaining_label.configure(
-                text=self._format_time(state.runtime_remaining)
-            )
-            
-            # Update idle wait indicator
-            if state.is_user_active and state.idle_wait_remaining > 0:
-                self.idle_wait_label.configure(
-                    text=f"⏳ User active - resuming in {state.idle_wait_remaining}s",
-                    fg=Colors.WARNING
-                )
-            else:
-                self.idle_wait_label.configure(text="")
-            
-            # Update next action timer
-            if state.phase == AutomationPhase.ACTIVE:
-                self.next_action_label.configure(
-                    text=str(state.next_action_in),
-                    fg=Colors.SUCCESS if state.next_action_in <= 2 else Colors.PRIMARY
-                )
-            elif state.phase == AutomationPhase.IDLE:
-                self.next_action_label.configure(text="--", fg=Colors.TEXT_DIM)
-            elif state.phase in (AutomationPhase.WAITING_IDLE, AutomationPhase.PAUSED):
-                self.next_action_label.configure(text="⏸️", fg=Colors.WARNING)
-            else:
-                self.next_action_label.configure(text="--", fg=Colors.TEXT_DIM)
-            
-            # Update cycle count
-            self.cycle_label.configure(text=str(state.cycle_count))
-            
-            # Update current app
-            app_text = state.current_app[:40] + "..." if len(state.current_app) > 40 else state.current_app
-            self.app_label.configure(text=app_text or "None")
-            
-            # Log last action (if changed)
+        # Privacy shield keeps the redacted placeholders - nothing to render
+        if self._privacy_enabled:
+            return
+        
+        # Log each reported action here, before snapshots are coalesced, so
+        # repeats of the same action reach the log's "(xN)" counter
+        if state.action_seq != self._last_logged_action_seq:
+            self._last_logged_action_seq = state.action_seq
             if state.last_action and state.last_action != "Starting...":
                 self._log_message(state.last_action)
         
-        # Schedule UI update on main thread
-        self.root.after(0, update_ui)
+        # Keep only the newest snapshot; a burst of callbacks before the Tk
+        # thread gets to run collapses into a single redraw
+        self._pending_state = state
+        if not self._ui_scheduled:
+            self._ui_scheduled = True
+            self._post(self._flush_ui)
+    
+    def _flush_ui(self) -> None:
+        """Render the newest pending scheduler state (runs on the Tk thread)."""
+        # Clear the flag before reading so a state posted meanwhile re-arms
+        self._ui_scheduled = False
+        state = self._pending_state
+        # Shield may have been enabled after this update was scheduled
+        if self._privacy_enabled:
+            return
+        # Nothing to do if this snapshot is identical to the last one shown
+        if state == self._last_state:
+            return
+        # At most one redraw per UI_MIN_INTERVAL - labels show whole seconds.
+        # Phase changes always render immediately.
+        now = time.monotonic()
+        delay = _redraw_delay(state, self._last_state, now - self._last_ui_ts, self.UI_MIN_INTERVAL)
+        if delay:
+            if self._ui_timer_job is None:
+                self._ui_timer_job = self.root.after(int(delay * 1000) + 1, self._on_ui_timer)
+            return
+        # Rendering now supersedes any held-back redraw
+        if self._ui_timer_job is not None:
+            self.root.after_cancel(self._ui_timer_job)
+            self._ui_timer_job = None
+        self._last_ui_ts = now
+        self._last_state = state
+        self._apply_state(state)
     
+    def _on_ui_timer(self) -> None:
+        """Render the redraw _flush_ui held back for UI_MIN_INTERVAL."""
+        self._ui_timer_job = None
+        self._flush_ui()
+    
+    def _apply_state(self, state: SchedulerState) -> None:
+        """
+        Write a scheduler state snapshot to the status labels.
+
+        Args:
+            state: Scheduler state to display
+        """
+        phase = state.phase
+        set_label = self._set_label
+        # Theme colors are fixed for the app lifetime
+        text_fg = Colors.TEXT
+        primary = Colors.PRIMARY
+        
+        # Update status label
+        text, fg = self._PHASE_STATUS.get(phase, self._STOPPED_STATUS)
+        set_label(self.status_label, text, fg)
+        
+        # Update timer
+        self._set_time_label(self.timer_label, state.time_remaining, text_fg)
+        
+        # Update runtime remaining
+        self._set_time_label(
+            self.runtime_remaining_label, state.runtime_remaining, primary
+        )
+        
+        # Update idle wait indicator
+        if state.is_user_active and state.idle_wait_remaining > 0:
+            set_label(
+                self.idle_wait_label,
+                f"⏳ User active - resuming in {state.idle_wait_remaining}s",
+                Colors.WARNING
+            )
+        else:
+            set_label(self.idle_wait_label, "")
+        
+        # Update next action timer (only the active phase shows a countdown)
+        if phase == AutomationPhase.ACTIVE:
+            set_label(
+                self.next_action_label,
+                str(state.next_action_in),
+                Colors.SUCCESS if state.next_action_in <= 2 else primary
+            )
+        else:
+            text, fg = self._NEXT_ACTION_STATIC.get(phase, self._NO_NEXT_ACTION)
+            set_label(self.next_action_label, text, fg)
+        
+        # Update cycle count
+        set_label(self.cycle_label, str(state.cycle_count), text_fg)
+        
+        # Update current app (only when it changed - wraplength forces
+        # Tk to re-measure the text on every configure)
+        app = state.current_app
+        if app != self._last_app:
+            self._last_app = app
+            if len(app) > 40:
+                app = app[:40] + "..."
+            set_label(self.app_label, app or "None", text_fg)
+        
+    
+    def _set_label(self, label: tk.Label, text: str, fg: Optional[str] = None) -> None:
+        """
+        Configure a dynamic label only when its text or color changed.
+
+        Args:
+            label: Label widget to update
+            text: New text
+            fg: New foreground color (None leaves it unchanged)
+        """
+        value = (text, fg)
+        if self._label_values.get(label) == value:
+            return
+        self._label_values[label] = value
+        if fg is None:
+            label.configure(text=text)
+        else:
+            label.configure(text=text, fg=fg)
+
+    def _set_time_label(self, label: tk.Label, seconds: int, fg: str) -> None:
+        """
+        Show a MM:SS value, formatting it only when the whole seconds changed.
+
+        Args:
+            label: Label widget to update
+            seconds: Time in seconds
+            fg: Foreground color
+        """
+        value = (seconds, fg)
+        if self._label_values.get(label) == value:
+            return
+        self._label_values[label] = value
+        label.configure(text=_format_mmss(seconds), fg=fg)
+
     def _set_settings_enabled(self, enabled: bool) -> None:
         """Enable or disable settings inputs."""
         state = tk.NORMAL if enabled else tk.DISABLED
-        self.active_min_entry.configure(state=state)
-        self.active_max_entry.configure(state=state)
-        self.idle_min_entry.configure(state=state)
-        self.idle_max_entry.configure(state=state)
-        self.app_switch_entry.configure(state=state)
-        self.idle_keepalive_entry.configure(state=state)
-        self.refresh_checkbox.configure(state=state)
-        self.total_runtime_entry.configure(state=state)
-        self.repeat_checkbox.configure(state=state)
-        self.shortcut_entry.configure(state=state)
-        self.force_logout_checkbox.configure(state=state)
-        self.simple_logout_checkbox.configure(state=state)
-        self.auto_lock_checkbox.configure(state=state)
+        for widget in self._toggleable_widgets:
+            widget.configure(state=state)
+        # Dependent entries follow their checkbox
         if enabled and self.refresh_var.get():
             self.refresh_interval_entry.configure(state=tk.NORMAL)
         else:
             self.refresh_interval_entry.configure(state=tk.DISABLED)
-        # Only enable auto_lock_monitor_entry if auto_lock is checked
         if enabled and self.auto_lock_var.get():
             self.auto_lock_monitor_entry.configure(state=tk.NORMAL)
         else:
-            self.auto_lock_monitor_entry.configure(state=tk.DISABLED if not enabled else 
-                                                   (tk.NORMAL if self.auto_lock_var.get() else tk.DISABLED))
+            self.auto_lock_monitor_entry.configure(state=tk.DISABLED)
+
+    @staticmethod
+    def _set_entry_text(entry: tk.Entry, text: str) -> None:
+        """Replace the text of an Entry, even while it is disabled."""
+        state = entry.cget("state")
+        if state != tk.NORMAL:
+            entry.configure(state=tk.NORMAL)
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+        if state != tk.NORMAL:
+            entry.configure(state=state)
 
     def _reset_defaults(self) -> None:
         """Reset timing inputs to default values."""
-        self.active_min_var.set(self._format_time(self.DEFAULT_ACTIVE_MIN_SEC))
-        self.active_max_var.set(self._format_time(self.DEFAULT_ACTIVE_MAX_SEC))
-        self.idle_min_var.set(self._format_time(self.DEFAULT_IDLE_MIN_SEC))
-        self.idle_max_var.set(self._format_time(self.DEFAULT_IDLE_MAX_SEC))
-        self.app_switch_var.set(self._format_time(self.DEFAULT_APP_SWITCH_SEC))
-        self.idle_keepalive_var.set(self._format_time(self.DEFAULT_IDLE_KEEPALIVE_SEC))
+        for name, _, default_text, _ in self._ALL_TIME_SETTINGS:
+            self._set_entry_text(getattr(self, f"{name}_entry"), default_text)
         self.refresh_var.set(False)
-        self.refresh_interval_var.set(self._format_time(self.DEFAULT_REFRESH_INTERVAL_SEC))
-        self.total_runtime_var.set(self._format_time(self.DEFAULT_RUNTIME_SEC))
         self.repeat_screens_var.set(True)
-        self.shortcut_var.set("Ctrl+Shift+P")
+        self._set_entry_text(self.shortcut_entry, "Ctrl+Shift+P")
         self.force_logout_var.set(False)
         self.simple_logout_var.set(False)
         self.auto_lock_var.set(False)
-        self.auto_lock_monitor_var.set(self._format_time(self.DEFAULT_AUTO_LOCK_MONITOR_SEC))
         self._on_refresh_toggle()
         self._on_auto_lock_toggle()  # Update entry state
     
@@ -1649,7 +2191,7 @@ class AutoWebApp:
             self.submit_btn.configure(state=tk.NORMAL)
             self._set_settings_enabled(True)
             # Show the window again
-            self.root.deiconify()
+            self._show_window()
         else:
             self._log_message("Failed to stop automation")
     
@@ -1663,30 +2205,42 @@ class AutoWebApp:
             # Perform simple logout (close app and lock screen)
             self._perform_simple_logout()
         
-        # Schedule on main thread
-        self.root.after(0, close_app)
+        # Run on main thread
+        self._post(close_app)
     
-    def _on_close(self) -> None:
-        """Handle window close event."""
-        try:
-            self.root.unbind_all("<MouseWheel>")
-        except Exception:
-            pass
+    def _release_resources(self) -> None:
+        """
+        Stop automation, unregister hotkeys and disable force logout.
 
+        Runs once: force logout, runtime expiry and the hotkeys can all
+        race into shutdown, and each repeat would wait on thread joins again.
+        """
+        if self._cleanup_done:
+            return
+        self._cleanup_done = True
+        
         # Stop automation if running
         if self.scheduler.is_running():
             self.scheduler.stop()
         
-        # Unregister hotkeys
+        # Unregister hotkeys (stop and pause/resume)
         self._unregister_hotkey()
         
-        # Stop pause/resume hotkey
-        if self._pause_resume_hotkey:
-            self._pause_resume_hotkey.stop()
-            self._pause_resume_hotkey = None
-        
         # Disable force logout
         self.force_logout_handler.enabled = False
+    
+    def _on_close(self) -> None:
+        """Handle window close event."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        try:
+            self.root.unbind_all("<MouseWheel>")
+        except Exception:
+            pass
+
+        self._release_resources()
         
         # Disable application protection for clean shutdown
         try:
@@ -1770,58 +2324,58 @@ class AutoWebApp:
         errors = []
         
         # Validate Active Time (min/max)
-        error = self._validate_time_input(self.active_min_var.get(), "Active Min", min_seconds=10, max_seconds=3600)
+        error = self._validate_time_input(self.active_min_entry.get(), "Active Min", min_seconds=10, max_seconds=3600)
         if error:
             errors.append(error)
-        error = self._validate_time_input(self.active_max_var.get(), "Active Max", min_seconds=10, max_seconds=3600)
+        error = self._validate_time_input(self.active_max_entry.get(), "Active Max", min_seconds=10, max_seconds=3600)
         if error:
             errors.append(error)
         
         # Validate Pause Time (min/max)
-        error = self._validate_time_input(self.idle_min_var.get(), "Pause Min", min_seconds=0, max_seconds=3600)
+        error = self._validate_time_input(self.idle_min_entry.get(), "Pause Min", min_seconds=0, max_seconds=3600)
         if error:
             errors.append(error)
-        error = self._validate_time_input(self.idle_max_var.get(), "Pause Max", min_seconds=0, max_seconds=3600)
+        error = self._validate_time_input(self.idle_max_entry.get(), "Pause Max", min_seconds=0, max_seconds=3600)
         if error:
             errors.append(error)
         
         # Validate App Switch interval
-        error = self._validate_time_input(self.app_switch_var.get(), "App Switch", min_seconds=30, max_seconds=3600)
+        error = self._validate_time_input(self.app_switch_entry.get(), "App Switch", min_seconds=30, max_seconds=3600)
         if error:
             errors.append(error)
 
         # Validate Idle Keepalive interval (0 = disabled)
-        error = self._validate_time_input(self.idle_keepalive_var.get(), "Idle Keepalive", min_seconds=0, max_seconds=3600)
+        error = self._validate_time_input(self.idle_keepalive_entry.get(), "Idle Keepalive", min_seconds=0, max_seconds=3600)
         if error:
             errors.append(error)
 
         # Validate Refresh interval (only when enabled)
         if self.refresh_var.get():
-            error = self._validate_time_input(self.refresh_interval_var.get(), "Refresh Interval", min_seconds=30, max_seconds=3600)
+            error = self._validate_time_input(self.refresh_interval_entry.get(), "Refresh Interval", min_seconds=30, max_seconds=3600)
             if error:
                 errors.append(error)
         
         # Validate Total Runtime
-        error = self._validate_time_input(self.total_runtime_var.get(), "Total Runtime", min_seconds=60, max_seconds=86400)
+        error = self._validate_time_input(self.total_runtime_entry.get(), "Total Runtime", min_seconds=60, max_seconds=86400)
         if error:
             errors.append(error)
         
         # Validate Auto Lock Monitor Time (only if enabled)
         if self.auto_lock_var.get():
-            error = self._validate_time_input(self.auto_lock_monitor_var.get(), "Auto Lock Monitor", min_seconds=60, max_seconds=3600)
+            error = self._validate_time_input(self.auto_lock_monitor_entry.get(), "Auto Lock Monitor", min_seconds=60, max_seconds=3600)
             if error:
                 errors.append(error)
         
         # Cross-validation: Active Max must be >= Active Min
         if not errors:
             try:
-                active_min = self._parse_time_quick(self.active_min_var.get())
-                active_max = self._parse_time_quick(self.active_max_var.get())
+                active_min = self._parse_time_quick(self.active_min_entry.get())
+                active_max = self._parse_time_quick(self.active_max_entry.get())
                 if active_max < active_min:
                     errors.append("Active Max must be greater than or equal to Active Min")
                 
-                idle_min = self._parse_time_quick(self.idle_min_var.get())
-                idle_max = self._parse_time_quick(self.idle_max_var.get())
+                idle_min = self._parse_time_quick(self.idle_min_entry.get())
+                idle_max = self._parse_time_quick(self.idle_max_entry.get())
                 if idle_max < idle_min:
                     errors.append("Pause Max must be greater than or equal to Pause Min")
             except:
@@ -1859,71 +2413,50 @@ class AutoWebApp:
         # Validate inputs first
         validation_errors = self._validate_inputs()
         if validation_errors:
+            # Only needed on this error path - imported on first use
+            from tkinter import messagebox
             error_msg = "\\n".join(validation_errors)
             messagebox.showerror("Invalid Input", f"Please fix the following errors:\\n\\n{error_msg}")
             return
         
         # Get settings from inputs
-        def _parse_time_to_seconds(value: str, default_seconds: int, assume_minutes: bool = True) -> int:
-            try:
-                text = value.strip()
-                if not text:
-                    return default_seconds
-                if ":" in text:
-                    parts = text.split(":")
-                    if len(parts) != 2:
-                        return default_seconds
-                    minutes = int(parts[0])
-                    seconds = int(parts[1])
-                    if minutes < 0 or seconds < 0:
-                        return default_seconds
-                    return (minutes * 60) + seconds
-                number = float(text)
-                if number < 0:
-                    return default_seconds
-                if assume_minutes:
-                    return int(round(number * 60))
-                return int(round(number))
-            except ValueError:
-                return default_seconds
-        
         active_min = _parse_time_to_seconds(
-            self.active_min_var.get(),
+            self.active_min_entry.get(),
             self.DEFAULT_ACTIVE_MIN_SEC,
             assume_minutes=True
         )
         active_max = _parse_time_to_seconds(
-            self.active_max_var.get(),
+            self.active_max_entry.get(),
             self.DEFAULT_ACTIVE_MAX_SEC,
             assume_minutes=True
         )
         idle_min = _parse_time_to_seconds(
-            self.idle_min_var.get(),
+            self.idle_min_entry.get(),
             self.DEFAULT_IDLE_MIN_SEC,
             assume_minutes=True
         )
         idle_max = _parse_time_to_seconds(
-            self.idle_max_var.get(),
+            self.idle_max_entry.get(),
             self.DEFAULT_IDLE_MAX_SEC,
             assume_minutes=True
         )
         app_switch = _parse_time_to_seconds(
-            self.app_switch_var.get(),
+            self.app_switch_entry.get(),
             self.DEFAULT_APP_SWITCH_SEC,
             assume_minutes=False
         )
         idle_keepalive = _parse_time_to_seconds(
-            self.idle_keepalive_var.get(),
+            self.idle_keepalive_entry.get(),
             self.DEFAULT_IDLE_KEEPALIVE_SEC,
             assume_minutes=True
         )
         refresh_interval = _parse_time_to_seconds(
-            self.refresh_interval_var.get(),
+            self.refresh_interval_entry.get(),
             self.DEFAULT_REFRESH_INTERVAL_SEC,
             assume_minutes=True
         )
         total_runtime = _parse_time_to_seconds(
-            self.total_runtime_var.get(),
+            self.total_runtime_entry.get(),
             self.DEFAULT_RUNTIME_SEC,
             assume_minutes=True
         )
@@ -1933,24 +2466,24 @@ class AutoWebApp:
         if idle_max < idle_min:
             idle_min, idle_max = idle_max, idle_min
         
-        active_min_display = self._format_time(active_min)
-        active_max_display = self._format_time(active_max)
-        idle_min_display = self._format_time(idle_min)
-        idle_max_display = self._format_time(idle_max)
-        app_switch_display = self._format_time(app_switch)
-        idle_keepalive_display = self._format_time(idle_keepalive)
-        refresh_interval_display = self._format_time(refresh_interval)
-        total_runtime_display = self._format_time(total_runtime)
+        active_min_display = _format_mmss(active_min)
+        active_max_display = _format_mmss(active_max)
+        idle_min_display = _format_mmss(idle_min)
+        idle_max_display = _format_mmss(idle_max)
+        app_switch_display = _format_mmss(app_switch)
+        idle_keepalive_display = _format_mmss(idle_keepalive)
+        refresh_interval_display = _format_mmss(refresh_interval)
+        total_runtime_display = _format_mmss(total_runtime)
         refresh_enabled = self.refresh_var.get()
         
         # Parse auto lock settings
         auto_lock_enabled = self.auto_lock_var.get()
         auto_lock_monitor_time = _parse_time_to_seconds(
-            self.auto_lock_monitor_var.get(),
+            self.auto_lock_monitor_entry.get(),
             self.DEFAULT_AUTO_LOCK_MONITOR_SEC,
             assume_minutes=True
         )
-        auto_lock_monitor_display = self._format_time(auto_lock_monitor_time)
+        auto_lock_monitor_display = _format_mmss(auto_lock_monitor_time)
         
         settings = {
             'active_min': active_min_display,
@@ -1964,13 +2497,16 @@ class AutoWebApp:
             'repeat_screens': "Yes" if self.repeat_screens_var.get() else "No",
             'force_logout': "ON \u26a0\ufe0f" if self.force_logout_var.get() else "OFF",
             'simple_logout': "ON 🚪" if self.simple_logout_var.get() else "OFF",
-            'shortcut': self.shortcut_var.get().strip(),
+            'shortcut': self.shortcut_entry.get().strip(),
             'auto_lock': f"ON (after {auto_lock_monitor_display})" if auto_lock_enabled else "OFF"
         }
         
-        # Show confirmation dialog (no shortcuts shown)
-        dialog = ConsentDialog(self.root, settings, privacy_mode=self.privacy_mode.get())
-        if not dialog.show():
+        # Show confirmation dialog (no shortcuts shown) - reused across submits
+        if self._consent_dialog is None:
+            self._consent_dialog = ConsentDialog(self.root, settings, privacy_mode=self._privacy_enabled)
+        else:
+            self._consent_dialog.set_settings(settings, privacy_mode=self._privacy_enabled)
+        if not self._consent_dialog.show():
             return  # User clicked Back
         
         # User confirmed - start automation
@@ -1986,34 +2522,33 @@ class AutoWebApp:
             f"Repeat Screens {'Yes' if self.repeat_screens_var.get() else 'No'}"
         )
         
-        # Register hotkey (Ctrl+Shift+Q to stop)
+        # Register hotkeys (Ctrl+Shift+Q to stop, configurable pause/resume,
+        # default Ctrl+Shift+P)
         self._register_hotkey()
         
-        # Register pause/resume hotkey (configurable, default Ctrl+Shift+P)
-        self._register_pause_resume_hotkey()
-        
         # Set up force logout handler
         self.force_logout_handler.enabled = self.force_logout_var.get()
         
-        # Apply settings to scheduler
+        # Apply settings to scheduler in a single update (SchedulerConfig is a
+        # plain dataclass, so its fields live in the instance __dict__).
         # Action interval is fast (3-8 seconds) for scroll, tab switch, mouse move
-        self.scheduler.config.action_interval_min = 3.0
-        self.scheduler.config.action_interval_max = 8.0
-        
-        self.scheduler.config.active_min = active_min
-        self.scheduler.config.active_max = active_max
-        self.scheduler.config.idle_min = idle_min
-        self.scheduler.config.idle_max = idle_max
-        self.scheduler.config.idle_keepalive_interval = idle_keepalive
-        self.scheduler.config.refresh_enabled = refresh_enabled
-        self.scheduler.config.refresh_interval = refresh_interval
-        self.scheduler.config.app_switch_interval = app_switch
-        self.scheduler.config.total_runtime = total_runtime
-        self.scheduler.config.repeat_screens = self.repeat_screens_var.get()
-        
-        # Configure auto lock feature
-        self.scheduler.config.auto_lock_enabled = auto_lock_enabled
-        self.scheduler.config.auto_lock_monitor_time = auto_lock_monitor_time
+        vars(self.scheduler.config).update({
+            'action_interval_min': 3.0,
+            'action_interval_max': 8.0,
+            'active_min': active_min,
+            'active_max': active_max,
+            'idle_min': idle_min,
+            'idle_max': idle_max,
+            'idle_keepalive_interval': idle_keepalive,
+            'refresh_enabled': refresh_enabled,
+            'refresh_interval': refresh_interval,
+            'app_switch_interval': app_switch,
+            'total_runtime': total_runtime,
+            'repeat_screens': self.repeat_screens_var.get(),
+            # Configure auto lock feature
+            'auto_lock_enabled': auto_lock_enabled,
+            'auto_lock_monitor_time': auto_lock_monitor_time,
+        })
         
         # Disable submit button
         self.submit_btn.configure(state=tk.DISABLED)
@@ -2040,7 +2575,7 @@ class AutoWebApp:
                 self._log_message(f"🔐 AUTO LOCK ENABLED - Monitoring starts after {auto_lock_monitor_display}")
             
             # Make window INVISIBLE
-            self.root.withdraw()  # Hide window completely
+            self._hide_window()  # Hide window completely
         else:
             self._log_message("Failed to start automation")
             self.submit_btn.configure(state=tk.NORMAL)
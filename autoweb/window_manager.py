@@ -18,19 +18,42 @@ windows. It does not modify, close, or manipulate window contents.
 
 import ctypes
 from ctypes import wintypes
-from typing import List, Tuple, Optional, Callable
-from dataclasses import dataclass
+from typing import List, NamedTuple, Tuple, Optional, Callable
 import logging
+import os
+import re
+import time
+
+import psutil
+
+from .input_simulator import INPUT, InputType, MouseEventFlags
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SendMessageTimeoutW parameters for reading window text
+WM_GETTEXT = 0x000D
+SMTO_BLOCK = 0x0001
+SMTO_ABORTIFHUNG = 0x0002
+GETTEXT_TIMEOUT_MS = 500
+
+# Direct wchar* -> str conversion for a known length
+_wstring_at = ctypes.wstring_at
+
+# Title keywords of MoniTask windows (main window and idle prompts)
+_MONITASK_TITLE_RE = re.compile(
+    r"monitask|confirmation|you've been idle|do you wish to pause|remove this time",
+    re.IGNORECASE,
+)
 
-@dataclass
-class WindowInfo:
+
+class WindowInfo(NamedTuple):
     """
-    Data class representing information about a window.
+    Lightweight record representing information about a window.
+    
+    A NamedTuple rather than a dataclass: no per-instance __dict__, and
+    enumeration builds one of these for every window.
     
     Attributes:
         hwnd: The window handle (unique identifier)
@@ -64,9 +87,10 @@ class WindowManager:
     
     def __init__(self):
         """Initialize the WindowManager with Windows API references."""
-        # Load Windows API functions
-        self.user32 = ctypes.windll.user32
-        self.kernel32 = ctypes.windll.kernel32
+        # Load Windows API functions. Private WinDLL instances so the
+        # prototypes below don't leak into other ctypes.windll users.
+        self.user32 = ctypes.WinDLL("user32", use_last_error=True)
+        self.kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
         
         # Define callback type for EnumWindows
         # WNDENUMPROC is a callback that receives (hwnd, lParam) and returns BOOL
@@ -76,15 +100,132 @@ class WindowManager:
             wintypes.LPARAM
         )
         
+        # Bind the functions used per window once, with prototypes, so each
+        # call skips the attribute lookup and generic argument conversion
+        self._IsWindowVisible = self.user32.IsWindowVisible
+        self._IsWindowVisible.argtypes = [wintypes.HWND]
+        self._IsWindowVisible.restype = wintypes.BOOL
+        self._IsWindow = self.user32.IsWindow
+        self._IsWindow.argtypes = [wintypes.HWND]
+        self._IsWindow.restype = wintypes.BOOL
+        self._IsIconic = self.user32.IsIconic
+        self._IsIconic.argtypes = [wintypes.HWND]
+        self._IsIconic.restype = wintypes.BOOL
+        self._GetWindowTextLengthW = self.user32.GetWindowTextLengthW
+        self._GetWindowTextLengthW.argtypes = [wintypes.HWND]
+        self._GetWindowTextLengthW.restype = ctypes.c_int
+        self._GetWindowTextW = self.user32.GetWindowTextW
+        self._GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+        self._GetWindowTextW.restype = ctypes.c_int
+        self._GetWindowLongW = self.user32.GetWindowLongW
+        self._GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+        self._GetWindowLongW.restype = wintypes.LONG
+        self._GetForegroundWindow = self.user32.GetForegroundWindow
+        self._GetForegroundWindow.argtypes = []
+        # Handles are only compared, never dereferenced: c_size_t returns a
+        # plain int (0 for none), matching the unsigned ints EnumWindows
+        # hands to the callback
+        self._GetForegroundWindow.restype = ctypes.c_size_t
+        self._SetForegroundWindow = self.user32.SetForegroundWindow
+        self._SetForegroundWindow.argtypes = [wintypes.HWND]
+        self._SetForegroundWindow.restype = wintypes.BOOL
+        self._SetFocus = self.user32.SetFocus
+        self._SetFocus.argtypes = [wintypes.HWND]
+        self._SetFocus.restype = wintypes.HWND
+        self._ShowWindow = self.user32.ShowWindow
+        self._ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+        self._ShowWindow.restype = wintypes.BOOL
+        self._EnumWindows = self.user32.EnumWindows
+        self._EnumWindows.argtypes = [self.WNDENUMPROC, wintypes.LPARAM]
+        self._EnumWindows.restype = wintypes.BOOL
+        self._EnumChildWindows = self.user32.EnumChildWindows
+        self._EnumChildWindows.argtypes = [wintypes.HWND, self.WNDENUMPROC, wintypes.LPARAM]
+        self._EnumChildWindows.restype = wintypes.BOOL
+        self._EnumThreadWindows = self.user32.EnumThreadWindows
+        self._EnumThreadWindows.argtypes = [wintypes.DWORD, self.WNDENUMPROC, wintypes.LPARAM]
+        self._EnumThreadWindows.restype = wintypes.BOOL
+        self._GetWindowRect = self.user32.GetWindowRect
+        self._GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+        self._GetWindowRect.restype = wintypes.BOOL
+        self._SetCursorPos = self.user32.SetCursorPos
+        self._SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+        self._SetCursorPos.restype = wintypes.BOOL
+        self._SendInput = self.user32.SendInput
+        self._SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+        self._SendInput.restype = wintypes.UINT
+        self._GetWindowThreadProcessId = self.user32.GetWindowThreadProcessId
+        self._GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+        self._GetWindowThreadProcessId.restype = wintypes.DWORD
+        self._AttachThreadInput = self.user32.AttachThreadInput
+        self._AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+        self._AttachThreadInput.restype = wintypes.BOOL
+        self._SendMessageTimeoutW = self.user32.SendMessageTimeoutW
+        self._SendMessageTimeoutW.argtypes = [
+            wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM,
+            wintypes.UINT, wintypes.UINT, ctypes.POINTER(ctypes.c_size_t)
+        ]
+        self._SendMessageTimeoutW.restype = wintypes.LPARAM
+        self._GetCurrentThreadId = self.kernel32.GetCurrentThreadId
+        self._GetCurrentThreadId.argtypes = []
+        self._GetCurrentThreadId.restype = wintypes.DWORD
+        
+        # Reused for every title read; nearly all titles fit
+        self._title_buf = ctypes.create_unicode_buffer(512)
+        # Out-parameters for _read_window_text, allocated once
+        self._owner_pid = wintypes.DWORD()
+        self._msg_result = ctypes.c_size_t()
+        self._pid = os.getpid()
+        
+        # Left button down + up, injected by one SendInput call per click
+        self._click_inputs = (INPUT * 2)()
+        for inp, flags in zip(self._click_inputs,
+                              (MouseEventFlags.LEFTDOWN, MouseEventFlags.LEFTUP)):
+            inp.type = InputType.MOUSE
+            inp.union.mi.dwFlags = flags
+        self._input_size = ctypes.sizeof(INPUT)
+        # Seconds to hold the button between down and up; some targets
+        # ignore zero-length clicks. 0 sends both as one atomic injection
+        self._click_delay = 0.1
+        
+        # Enumeration trampolines live as long as the manager;
+        # get_all_windows() / _enumerate_hwnds() point _enum_results at
+        # their list while it runs
+        self._enum_results: Optional[list] = None
+        # Same for EnumChildWindows; click_button_by_text() sets _child_search
+        # and whether the parent (so every child) belongs to this process
+        self._child_search: Optional[str] = None
+        self._child_in_process = False
+        self._child_enum_proc = self.WNDENUMPROC(self._enum_child_callback)
+        # Handle-only enumeration for callers that don't need titles
+        self._hwnd_enum_proc = self.WNDENUMPROC(self._enum_hwnd_callback)
+        # Top-level windows of this process, collected on the first
+        # enumeration after invalidate_cache() so title reads need no
+        # per-window owner lookup
+        self._own_hwnds: set = set()
+        self._own_hwnds_valid = False
+        self._process = psutil.Process(self._pid)
+        self._own_enum_proc = self.WNDENUMPROC(self._enum_own_callback)
+        
         # Windows to exclude (system windows, background processes)
-        self._excluded_titles = [
+        # (a frozenset - checked once per window during enumeration)
+        self._excluded_titles = frozenset((
             "Program Manager",
             "Windows Input Experience",
             "Settings",
             "Microsoft Text Input Application",
             "NVIDIA GeForce Overlay",
             "",  # Empty titles
-        ]
+        ))
+        self._excluded_lengths = frozenset(len(title) for title in self._excluded_titles)
+        
+        # Built after the exclusion list, which the callback binds
+        self._enum_proc = self.WNDENUMPROC(self._build_enum_window_callback())
+        
+        # Short-lived cache of get_all_windows() results, so callers that
+        # query several times in a row share one enumeration
+        self._cache: Optional[List[WindowInfo]] = None
+        self._cache_ts = 0.0
+        self._cache_ttl = 0.05  # seconds
         
         logger.info("WindowManager initialized successfully")
     
@@ -98,10 +239,61 @@ class WindowManager:
         - The callback receives the window handle (hwnd) and can process it
         - We filter for visible windows with titles (main application windows)
         
+        Results are reused for up to _cache_ttl seconds; call
+        invalidate_cache() when a fresh enumeration is required.
+        
         Returns:
             List of WindowInfo objects representing each detected window
         """
-        windows: List[WindowInfo] = []
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self._cache_ttl:
+            return list(self._cache)
+        
+        found: List[Tuple[int, str]] = []
+        
+        if not self._own_hwnds_valid:
+            self._collect_own_windows()
+        
+        # Enumerate windows through the trampoline built once in __init__
+        self._enum_results = found
+        try:
+            self._EnumWindows(self._enum_proc, 0)
+        finally:
+            self._enum_results = None
+        
+        # Wrap the accepted windows once enumeration is done, keeping the
+        # per-window callback down to the Win32 checks
+        windows = [WindowInfo(hwnd, title, True) for hwnd, title in found]
+        
+        self._cache = windows
+        self._cache_ts = now
+        
+        logger.debug(f"Found {len(windows)} windows")
+        return list(windows)
+    
+    def invalidate_cache(self) -> None:
+        """Force the next get_all_windows() call to re-enumerate."""
+        self._cache = None
+        self._own_hwnds_valid = False
+    
+    def _build_enum_window_callback(self) -> Callable[[int, int], bool]:
+        """
+        Build the EnumWindows callback used by get_all_windows().
+        
+        Everything the callback touches per window is bound here once, so
+        each call reads closure cells instead of attributes on self.
+        
+        Returns:
+            Callback that appends accepted windows to _enum_results as
+            (hwnd, title)
+        """
+        is_window_visible = self._IsWindowVisible
+        is_iconic = self._IsIconic
+        get_window_long = self._GetWindowLongW
+        get_window_text_length = self._GetWindowTextLengthW
+        read_window_text = self._read_window_text
+        excluded_titles = self._excluded_titles
+        own_hwnds = self._own_hwnds  # Refilled in place on invalidation
         
         def enum_callback(hwnd: int, lParam: int) -> bool:
             """
@@ -114,53 +306,157 @@ class WindowManager:
             Returns:
                 True to continue enumeration, False to stop
             """
+            # Cheap in-process checks first; the title copy below can mean a
+            # cross-process WM_GETTEXT, so only windows that pass reach it
+            
             # Check if window is visible
             # IsWindowVisible returns non-zero if the window is visible
-            if not self.user32.IsWindowVisible(hwnd):
+            if not is_window_visible(hwnd):
                 return True  # Continue enumeration
             
+            # Check if window is minimized (IsIconic returns non-zero if minimized)
+            if is_iconic(hwnd):
+                return True  # Skip minimized windows
+            
+            # Skip windows that are tool windows or have no taskbar presence
+            # GWL_EXSTYLE = -20, WS_EX_TOOLWINDOW = 0x00000080
+            if get_window_long(hwnd, -20) & 0x00000080:
+                return True
+            
             # Get window title length
-            length = self.user32.GetWindowTextLengthW(hwnd)
+            length = get_window_text_length(hwnd)
             if length == 0:
                 return True  # Skip windows without titles
             
             # Get window title
             # GetWindowTextW retrieves the text of the window's title bar
-            buffer = ctypes.create_unicode_buffer(length + 1)
-            self.user32.GetWindowTextW(hwnd, buffer, length + 1)
-            title = buffer.value
+            # (ownership from the collected set; per-window lookup if that
+            # could not be built)
+            title = read_window_text(
+                hwnd, length, hwnd in own_hwnds if self._own_hwnds_valid else None
+            )
             
             # Skip excluded windows
-            if title in self._excluded_titles:
-                return True
-            
-            # Skip windows that are tool windows or have no taskbar presence
-            # GWL_EXSTYLE = -20, WS_EX_TOOLWINDOW = 0x00000080
-            ex_style = self.user32.GetWindowLongW(hwnd, -20)
-            if ex_style & 0x00000080:  # WS_EX_TOOLWINDOW
+            if title in excluded_titles:
                 return True
             
-            # Check if window is minimized (IsIconic returns non-zero if minimized)
-            is_minimized = self.user32.IsIconic(hwnd)
-            if is_minimized:
-                return True  # Skip minimized windows
-            
-            # Create WindowInfo and add to list
-            window_info = WindowInfo(
-                hwnd=hwnd,
-                title=title,
-                is_visible=True
-            )
-            windows.append(window_info)
+            self._enum_results.append((hwnd, title))
             
             return True  # Continue enumeration
         
-        # Create callback and enumerate windows
-        callback = self.WNDENUMPROC(enum_callback)
-        self.user32.EnumWindows(callback, 0)
+        return enum_callback
+    
+    def _enumerate_hwnds(self) -> List[int]:
+        """
+        Enumerate the same windows as get_all_windows(), handles only.
         
-        logger.debug(f"Found {len(windows)} windows")
-        return windows
+        Titles are read only when needed to apply the exclusion list,
+        and no WindowInfo objects are built.
+        
+        Returns:
+            List of window handles in enumeration order
+        """
+        hwnds: List[int] = []
+        self._enum_results = hwnds
+        try:
+            self._EnumWindows(self._hwnd_enum_proc, 0)
+        finally:
+            self._enum_results = None
+        return hwnds
+    
+    def _enum_hwnd_callback(self, hwnd: int, lParam: int) -> bool:
+        """
+        EnumWindows callback for _enumerate_hwnds(); same filters as
+        get_all_windows().
+        
+        Args:
+            hwnd: Handle to the current window
+            lParam: Application-defined value (unused here)
+        
+        Returns:
+            True to continue enumeration
+        """
+        if not self._IsWindowVisible(hwnd) or self._IsIconic(hwnd):
+            return True
+        if self._GetWindowLongW(hwnd, -20) & 0x00000080:  # WS_EX_TOOLWINDOW
+            return True
+        length = self._GetWindowTextLengthW(hwnd)
+        if length == 0:
+            return True
+        # A title can only be excluded if its length matches an excluded one
+        if length in self._excluded_lengths and \
+                self._read_window_text(hwnd, length) in self._excluded_titles:
+            return True
+        self._enum_results.append(hwnd)
+        return True
+    
+    def _collect_own_windows(self) -> None:
+        """
+        Refill _own_hwnds with the top-level windows of this process.
+        
+        Every OS thread of the process is visited, native ones included,
+        so windows are found whichever thread created them.
+        """
+        self._own_hwnds.clear()
+        try:
+            threads = self._process.threads()
+        except psutil.Error as e:
+            # Leave the set invalid; titles fall back to per-window lookups
+            logger.debug(f"Could not list process threads: {e}")
+            return
+        for thread in threads:
+            self._EnumThreadWindows(thread.id, self._own_enum_proc, 0)
+        self._own_hwnds_valid = True
+    
+    def _enum_own_callback(self, hwnd: int, lParam: int) -> bool:
+        """EnumThreadWindows callback for _collect_own_windows()."""
+        self._own_hwnds.add(hwnd)
+        return True
+    
+    def _is_own_window(self, hwnd: int) -> bool:
+        """Check whether a window belongs to this process."""
+        self._GetWindowThreadProcessId(hwnd, ctypes.byref(self._owner_pid))
+        return self._owner_pid.value == self._pid
+    
+    def _read_window_text(self, hwnd: int, length: int,
+                          in_process: Optional[bool] = None) -> str:
+        """
+        Read a window's text into the shared title buffer.
+        
+        GetWindowTextW only sends WM_GETTEXT to windows of our own process
+        (other processes' captions are read directly), and that send waits
+        for the owning thread - e.g. the Tk thread while it is busy. Those
+        windows are read with SendMessageTimeoutW instead so a stalled
+        thread cannot hang enumeration.
+        
+        Args:
+            hwnd: Window handle
+            length: Text length from GetWindowTextLengthW
+            in_process: Whether the window belongs to this process, if the
+                caller already knows; looked up when None
+        
+        Returns:
+            The window text
+        """
+        buffer = self._title_buf
+        if length >= len(buffer):
+            # Rare long title - fall back to a one-off buffer
+            buffer = ctypes.create_unicode_buffer(length + 1)
+        if in_process is None:
+            in_process = self._is_own_window(hwnd)
+        if in_process:
+            if not self._SendMessageTimeoutW(
+                hwnd, WM_GETTEXT, length + 1, ctypes.addressof(buffer),
+                SMTO_ABORTIFHUNG | SMTO_BLOCK, GETTEXT_TIMEOUT_MS,
+                ctypes.byref(self._msg_result)
+            ):
+                return ""
+            copied = self._msg_result.value
+        else:
+            copied = self._GetWindowTextW(hwnd, buffer, length + 1)
+        # Both calls report the characters copied, so build the str from
+        # that count instead of scanning for the terminator via .value
+        return _wstring_at(buffer, min(copied, length))
     
     def get_foreground_window(self) -> Optional[WindowInfo]:
         """
@@ -172,25 +468,26 @@ class WindowManager:
         Returns:
             WindowInfo for the active window, or None if unavailable
         """
-        hwnd = self.user32.GetForegroundWindow()
+        hwnd = self._GetForegroundWindow()
         
         if not hwnd:
             return None
         
         # Get window title
-        length = self.user32.GetWindowTextLengthW(hwnd)
+        length = self._GetWindowTextLengthW(hwnd)
         if length == 0:
             return WindowInfo(hwnd=hwnd, title="Unknown", is_visible=True)
         
-        buffer = ctypes.create_unicode_buffer(length + 1)
-        self.user32.GetWindowTextW(hwnd, buffer, length + 1)
-        
         return WindowInfo(
             hwnd=hwnd,
-            title=buffer.value,
+            title=self._read_window_text(hwnd, length),
             is_visible=True
         )
     
+    def _get_foreground_hwnd(self) -> int:
+        """Get the handle of the foreground window without reading its title."""
+        return self._GetForegroundWindow()
+    
     def switch_to_window(self, hwnd: int) -> bool:
         """
         Switch focus to a specific window by its handle.
@@ -208,22 +505,24 @@ class WindowManager:
         """
         try:
             # Check if window still exists
-            if not self.user32.IsWindow(hwnd):
+            if not self._IsWindow(hwnd):
                 logger.debug(f"Window {hwnd} no longer exists")
                 return False
             
             # Check if window is minimized - if so, skip it (don't restore)
-            if self.user32.IsIconic(hwnd):
+            if self._IsIconic(hwnd):
                 logger.debug(f"Window {hwnd} is minimized - skipping (no restore)")
                 return False
             
             # Check if window is visible
-            if not self.user32.IsWindowVisible(hwnd):
+            if not self._IsWindowVisible(hwnd):
                 logger.debug(f"Window {hwnd} is not visible - skipping")
                 return False
             
             # SetForegroundWindow brings the window to the front WITHOUT changing its state
-            result = self.user32.SetForegroundWindow(hwnd)
+            result = self._SetForegroundWindow(hwnd)
+            # Z-order (and so enumeration order) changes with the foreground
+            self.invalidate_cache()
             
             if result:
                 logger.info(f"Switched to window with handle {hwnd}")
@@ -231,26 +530,26 @@ class WindowManager:
             else:
                 # Alternative method using AttachThreadInput
                 # This attaches our thread's input to the foreground thread
-                foreground_hwnd = self.user32.GetForegroundWindow()
+                foreground_hwnd = self._GetForegroundWindow()
                 if not foreground_hwnd:
                     return False
                     
-                foreground_thread = self.user32.GetWindowThreadProcessId(
+                foreground_thread = self._GetWindowThreadProcessId(
                     foreground_hwnd, None
                 )
-                current_thread = self.kernel32.GetCurrentThreadId()
+                current_thread = self._GetCurrentThreadId()
                 
                 # Attach threads to share input state
-                self.user32.AttachThreadInput(
+                self._AttachThreadInput(
                     foreground_thread, current_thread, True
                 )
                 
                 # Now try to set foreground window (no restore/minimize)
-                self.user32.SetForegroundWindow(hwnd)
-                self.user32.SetFocus(hwnd)
+                self._SetForegroundWindow(hwnd)
+                self._SetFocus(hwnd)
                 
                 # Detach threads
-                self.user32.AttachThreadInput(
+                self._AttachThreadInput(
                     foreground_thread, current_thread, False
                 )
                 
@@ -270,32 +569,30 @@ class WindowManager:
         Returns:
             WindowInfo of the newly focused window, or None if failed
         """
-        windows = self.get_all_windows()
+        # Handles are enough to pick the next window; only the one we
+        # switch to gets its title read
+        hwnds = self._enumerate_hwnds()
         
-        if len(windows) < 2:
+        if len(hwnds) < 2:
             logger.warning("Not enough windows to switch")
             return None
         
-        current = self.get_foreground_window()
-        if not current:
+        current_hwnd = self._get_foreground_hwnd()
+        if not current_hwnd:
             # Just switch to the first window
-            if self.switch_to_window(windows[0].hwnd):
-                return windows[0]
-            return None
-        
-        # Find current window in list and switch to next
-        current_index = -1
-        for i, window in enumerate(windows):
-            if window.hwnd == current.hwnd:
-                current_index = i
-                break
-        
-        # Calculate next index (wrap around)
-        next_index = (current_index + 1) % len(windows)
-        next_window = windows[next_index]
-        
-        if self.switch_to_window(next_window.hwnd):
-            return next_window
+            next_hwnd = hwnds[0]
+        else:
+            # Find current window in list and switch to next (wrap around)
+            try:
+                current_index = hwnds.index(current_hwnd)
+            except ValueError:
+                current_index = -1
+            next_hwnd = hwnds[(current_index + 1) % len(hwnds)]
+        
+        if self.switch_to_window(next_hwnd):
+            length = self._GetWindowTextLengthW(next_hwnd)
+            title = self._read_window_text(next_hwnd, length) if length > 0 else ""
+            return WindowInfo(next_hwnd, title, True)
         
         return None
     
@@ -306,7 +603,7 @@ class WindowManager:
         Returns:
             Number of detected windows
         """
-        return len(self.get_all_windows())
+        return len(self._enumerate_hwnds())
     
     def is_window_minimized(self, hwnd: int) -> bool:
         """
@@ -318,7 +615,7 @@ class WindowManager:
         Returns:
             True if the window is minimized, False otherwise
         """
-        return bool(self.user32.IsIconic(hwnd))
+        return bool(self._IsIconic(hwnd))
     
     def get_visible_windows(self) -> List[WindowInfo]:
         """
@@ -341,19 +638,9 @@ class WindowManager:
         Returns:
             List of MoniTask windows found
         """
-        all_windows = self.get_all_windows()
-        monitask_windows = []
-        
-        for window in all_windows:
-            title_lower = window.title.lower()
-            # Look for various MoniTask window titles
-            if any(keyword in title_lower for keyword in [
-                'monitask', 'confirmation', 'you\'ve been idle', 
-                'do you wish to pause', 'remove this time'
-            ]):
-                monitask_windows.append(window)
-                
-        return monitask_windows
+        # One case-insensitive scan per title instead of lower() + five searches
+        search = _MONITASK_TITLE_RE.search
+        return [window for window in self.get_all_windows() if search(window.title)]
     
     def minimize_window(self, hwnd: int) -> bool:
         """
@@ -367,8 +654,9 @@ class WindowManager:
         """
         try:
             # SW_MINIMIZE = 6
-            result = self.user32.ShowWindow(hwnd, 6)
+            result = self._ShowWindow(hwnd, 6)
             if result:
+                self.invalidate_cache()
                 logger.info(f"Successfully minimized window {hwnd}")
                 return True
             else:
@@ -390,38 +678,15 @@ class WindowManager:
             True if button was found and clicked, False otherwise
         """
         try:
-            # Try to find child controls (buttons) in the window
-            def enum_child_proc(child_hwnd, lparam):
-                try:
-                    # Get the text of the child control
-                    length = self.user32.GetWindowTextLengthW(child_hwnd)
-                    if length > 0:
-                        buffer = ctypes.create_unicode_buffer(length + 1)
-                        self.user32.GetWindowTextW(child_hwnd, buffer, length + 1)
-                        child_text = buffer.value
-                        
-                        # Check if this is the button we're looking for
-                        if button_text.lower() in child_text.lower():
-                            # Get button position and size
-                            rect = wintypes.RECT()
-                            if self.user32.GetWindowRect(child_hwnd, ctypes.byref(rect)):
-                                # Calculate center of button
-                                x = (rect.left + rect.right) // 2
-                                y = (rect.top + rect.bottom) // 2
-                                
-                                # Click the button
-                                self._click_at_position(x, y)
-                                logger.info(f"Clicked button '{child_text}' at ({x}, {y})")
-                                return False  # Stop enumeration
-                except Exception as e:
-                    logger.debug(f"Error processing child window: {e}")
-                    
-                return True  # Continue enumeration
-            
-            # Enumerate child windows to find buttons
-            WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
-            enum_proc = WNDENUMPROC(enum_child_proc)
-            self.user32.EnumChildWindows(hwnd, enum_proc, 0)
+            # Enumerate child windows to find buttons, through the
+            # trampoline built once in __init__
+            self._child_search = button_text.lower()
+            # Children share their parent's process - look it up once
+            self._child_in_process = self._is_own_window(hwnd)
+            try:
+                self._EnumChildWindows(hwnd, self._child_enum_proc, 0)
+            finally:
+                self._child_search = None
             
             return True
             
@@ -429,6 +694,45 @@ class WindowManager:
             logger.error(f"Error clicking button '{button_text}' in window {hwnd}: {e}")
             return False
     
+    def _enum_child_callback(self, child_hwnd: int, lparam: int) -> bool:
+        """
+        EnumChildWindows callback: click the child whose text contains
+        _child_search (already lowercased).
+        
+        Args:
+            child_hwnd: Handle to the current child window
+            lparam: Application-defined value (unused here)
+        
+        Returns:
+            True to continue enumeration, False to stop
+        """
+        # Controls without text can't match - skip them before any other work
+        length = self._GetWindowTextLengthW(child_hwnd)
+        if length <= 0:
+            return True
+        try:
+            # Get the text of the child control
+            child_text = self._read_window_text(child_hwnd, length, self._child_in_process)
+            
+            # Check if this is the button we're looking for
+            if self._child_search in child_text.lower():
+                # Get button position and size
+                rect = wintypes.RECT()
+                if self._GetWindowRect(child_hwnd, ctypes.byref(rect)):
+                    # Calculate center of button
+                    x = (rect.left + rect.right) // 2
+                    y = (rect.top + rect.bottom) // 2
+                    
+                    # Click the button
+                    self._click_at_position(x, y)
+                    logger.info(f"Clicked button '{child_text}' at ({x}, {y})")
+                    return False  # Stop enumeration
+        except Exception as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Error processing child window: {e}")
+            
+        return True  # Continue enumeration
+    
     def _click_at_position(self, x: int, y: int):
         """
         Perform a mouse click at the specified screen coordinates.
@@ -437,18 +741,18 @@ class WindowManager:
             x: X coordinate
             y: Y coordinate
         """
-        # Set cursor position
-        self.user32.SetCursorPos(x, y)
-        
-        # Mouse down
-        self.user32.mouse_event(0x0002, x, y, 0, 0)  # MOUSEEVENTF_LEFTDOWN
-        
-        # Small delay
-        import time
-        time.sleep(0.1)
-        
-        # Mouse up  
-        self.user32.mouse_event(0x0004, x, y, 0, 0)  # MOUSEEVENTF_LEFTUP
+        # Set cursor position (pixel-exact on any monitor, unlike
+        # SendInput's normalized absolute coordinates)
+        self._SetCursorPos(x, y)
+        
+        if self._click_delay > 0:
+            down, up = self._click_inputs
+            self._SendInput(1, ctypes.byref(down), self._input_size)
+            time.sleep(self._click_delay)
+            self._SendInput(1, ctypes.byref(up), self._input_size)
+        else:
+            # Mouse down + up as one atomic injection
+            self._SendInput(2, self._click_inputs, self._input_size)
 
 
 # Example usage and testing
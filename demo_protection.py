@@ -25,58 +25,54 @@ To disable protection for testing:
     Create a file named "emergency_disable.txt"
 """
 
-import os
 import sys
-import time
 import logging
 
-# Add autoweb to path
-sys.path.insert(0, os.path.dirname(__file__))
-
 from autoweb.protection import enable_application_protection, disable_application_protection
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Console text, each written with a single call
+BANNER = """\
+🔒 AutoWeb Protection Demo
+==============================
+
+This demo shows how the protection system works.
+If you close this script unexpectedly, your system will lock.
+
+System Events Handled:
+• User logout → Application stops cleanly
+• System shutdown → Application stops cleanly
+• System sleep/hibernate → Application stops cleanly
+• Workstation lock (Win+L) → Application stops cleanly
+• Unexpected termination → System locks
+
+"""
+
+ENABLED_NOTICE = """\
+✅ Protection enabled!
+
+Try closing this window or pressing Ctrl+C...
+The system should lock automatically.
+
+(To disable protection, create 'emergency_disable.txt' file)
+
+"""
+
 def main():
-    print("🔒 AutoWeb Protection Demo")
-    print("=" * 30)
-    print()
-    
-    print("This demo shows how the protection system works.")
-    print("If you close this script unexpectedly, your system will lock.")
-    print()
-    print("System Events Handled:")
-    print("• User logout → Application stops cleanly")
-    print("• System shutdown → Application stops cleanly")
-    print("• System sleep/hibernate → Application stops cleanly")
-    print("• Workstation lock (Win+L) → Application stops cleanly")
-    print("• Unexpected termination → System locks")
-    print()
+    logging.basicConfig(level=logging.INFO)
+    sys.stdout.write(BANNER)
     
     # Enable protection
     protection = enable_application_protection("emergency_disable.txt")
     
-    print("✅ Protection enabled!")
-    print()
-    print("Try closing this window or pressing Ctrl+C...")
-    print("The system should lock automatically.")
-    print()
-    print("(To disable protection, create 'emergency_disable.txt' file)")
-    print()
+    sys.stdout.write(ENABLED_NOTICE)
     
     try:
-        counter = 0
-        while True:
-            # Check if protection system detected shutdown event
-            if protection.should_shutdown:
-                print(f"\n\n🛑 Shutdown detected: {protection.shutdown_reason}")
-                print("Application stopping cleanly...")
-                break
-                
-            counter += 1
-            print(f"Running with protection... {counter:03d}s", end='\r')
-            time.sleep(1)
+        protection.wait_with_status("Running with protection...")
+        
+        print(f"\n\n🛑 Shutdown detected: {protection.shutdown_reason}")
+        print("Application stopping cleanly...")
     
     except KeyboardInterrupt:
         print("\n\nCtrl+C pressed - Normal shutdown")
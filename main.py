@@ -26,17 +26,36 @@ IMPORTANT: This tool is for automation testing and accessibility use cases only.
 import sys
 import logging
 import ctypes
+import importlib.util
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)  # Only console output
-    ]
-)
 logger = logging.getLogger(__name__)
 
+PROCESS_PER_MONITOR_DPI_AWARE = 2
+
+# DPI awareness entry points, resolved once at import. Either is None when
+# unavailable (older Windows, or not Windows at all - check_platform reports that).
+try:
+    _SetProcessDpiAwareness = ctypes.WinDLL("shcore").SetProcessDpiAwareness
+    _SetProcessDpiAwareness.argtypes = [ctypes.c_int]
+    _SetProcessDpiAwareness.restype = ctypes.c_long
+except (OSError, AttributeError):
+    _SetProcessDpiAwareness = None
+
+try:
+    _SetProcessDPIAware = ctypes.WinDLL("user32").SetProcessDPIAware
+    _SetProcessDPIAware.argtypes = []
+    _SetProcessDPIAware.restype = ctypes.c_int
+except (OSError, AttributeError):
+    _SetProcessDPIAware = None
+
+# Startup banner, written with a single call
+BANNER = f"""\
+{"=" * 60}
+  🤖 AutoWeb - UI Automation & Accessibility Testing Tool
+{"=" * 60}
+
+"""
+
 
 def check_platform():
     """
@@ -61,25 +80,20 @@ def check_dependencies():
     
     Checks for:
     - tkinter (UI framework)
-    - ctypes (Windows API access)
+    
+    ctypes is imported at module level, so it is known to be present.
     
     Returns:
         bool: True if all dependencies are available
     """
     missing = []
     
-    # Check tkinter
-    try:
-        import tkinter
-    except ImportError:
+    # Check tkinter (and its _tkinter extension) - find_spec locates them
+    # without loading Tcl/Tk; the real import happens with the UI
+    if importlib.util.find_spec("tkinter") is None or \
+            importlib.util.find_spec("_tkinter") is None:
         missing.append("tkinter")
     
-    # Check ctypes (should always be available in standard Python)
-    try:
-        import ctypes
-    except ImportError:
-        missing.append("ctypes")
-    
     if missing:
         logger.error(f"Missing dependencies: {', '.join(missing)}")
         print(f"❌ Error: Missing required dependencies: {', '.join(missing)}")
@@ -96,17 +110,18 @@ def set_dpi_awareness():
     Windows 10+ supports per-monitor DPI awareness, which ensures
     the application renders correctly on high-resolution displays.
     """
-    try:
-        # Try Windows 10+ per-monitor DPI awareness
-        ctypes.windll.shcore.SetProcessDpiAwareness(2)
+    # Try Windows 10+ per-monitor DPI awareness (returns an HRESULT)
+    if _SetProcessDpiAwareness is not None and \
+            _SetProcessDpiAwareness(PROCESS_PER_MONITOR_DPI_AWARE) == 0:
         logger.info("Set per-monitor DPI awareness")
-    except Exception:
-        try:
-            # Fallback to Windows 8.1 system DPI awareness
-            ctypes.windll.user32.SetProcessDPIAware()
-            logger.info("Set system DPI awareness")
-        except Exception as e:
-            logger.warning(f"Could not set DPI awareness: {e}")
+        return
+    
+    # Fallback to Windows 8.1 system DPI awareness
+    if _SetProcessDPIAware is not None and _SetProcessDPIAware():
+        logger.info("Set system DPI awareness")
+        return
+    
+    logger.warning("Could not set DPI awareness")
 
 
 def main():
@@ -115,10 +130,17 @@ def main():
     
     Performs platform and dependency checks, enables protection, then launches the UI.
     """
-    print("=" * 60)
-    print("  🤖 AutoWeb - UI Automation & Accessibility Testing Tool")
-    print("=" * 60)
-    print()
+    # Configure logging (here rather than at import, so importing this
+    # module has no side effects)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(sys.stdout)  # Only console output
+        ]
+    )
+    
+    sys.stdout.write(BANNER)
     
     # Platform check
     check_platform()
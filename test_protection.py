@@ -26,46 +26,77 @@ import os
 import time
 import logging
 
-# Add the autoweb package to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from autoweb.protection import enable_application_protection, disable_application_protection
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+EMERGENCY_FILE = "emergency_disable.txt"
+
+# Console text, each written with a single call
+BANNER = f"""\
+{"=" * 60}
+  🔒 AutoWeb Protection Test
+{"=" * 60}
+
+This script tests the application protection system.
+If terminated unexpectedly, the system will lock (Win+L).
+
+Emergency bypass:
+  Create '{EMERGENCY_FILE}' file to disable protection
+
+"""
+
+BYPASS_NOTICE = f"""\
+🟡 EMERGENCY DISABLE DETECTED - Protection will be bypassed!
+   Remove '{EMERGENCY_FILE}' to enable protection
+"""
+
+PROTECTED_NOTICE = """\
+🔒 PROTECTION WILL BE ENABLED
+   System will lock if this script is terminated
+"""
+
+ENABLED_NOTICE = f"""\
+
+✅ Protection enabled!
+
+Try to terminate this script using:
+  • Ctrl+C
+  • Closing this terminal window
+  • Task Manager -> End Process
+  • Any other method
+
+The system should lock automatically unless emergency file exists.
+
+To stop normally: Press Ctrl+C, then press Enter when prompted
+{"-" * 60}
+"""
+
 def main():
-    print("=" * 60)
-    print("  🔒 AutoWeb Protection Test")
-    print("=" * 60)
-    print()
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     
-    print("This script tests the application protection system.")
-    print("If terminated unexpectedly, the system will lock (Win+L).")
-    print()
-    print("Emergency bypass:")
-    print("  Create 'emergency_disable.txt' file to disable protection")
-    print()
+    sys.stdout.write(BANNER)
     
     # Check if emergency disable exists
-    emergency_file = "emergency_disable.txt"
+    emergency_file = EMERGENCY_FILE
     if os.path.exists(emergency_file):
-        print("🟡 EMERGENCY DISABLE DETECTED - Protection will be bypassed!")
-        print(f"   Remove '{emergency_file}' to enable protection")
+        sys.stdout.write(BYPASS_NOTICE)
     else:
-        print("🔒 PROTECTION WILL BE ENABLED")
-        print("   System will lock if this script is terminated")
-    
-    print()
-    print("Starting protection test in 3 seconds...")
+        sys.stdout.write(PROTECTED_NOTICE)
     
-    for i in range(3, 0, -1):
-        print(f"   {i}...")
-        time.sleep(1)
+    # The countdown is only for someone watching - skip it when output
+    # is redirected (CI, logs)
+    if sys.stdout.isatty():
+        print()
+        print("Starting protection test in 3 seconds...")
+        
+        for i in range(3, 0, -1):
+            print(f"   {i}...")
+            time.sleep(1)
     
     print()
     print("🚀 Starting protection test...")
@@ -73,27 +104,12 @@ def main():
     # Enable protection
     protection = enable_application_protection(emergency_file)
     
-    print()
-    print("✅ Protection enabled!")
-    print()
-    print("Try to terminate this script using:")
-    print("  • Ctrl+C")
-    print("  • Closing this terminal window")
-    print("  • Task Manager -> End Process")
-    print("  • Any other method")
-    print()
-    print("The system should lock automatically unless emergency file exists.")
-    print()
-    print("To stop normally: Press Ctrl+C, then press Enter when prompted")
-    print("-" * 60)
+    sys.stdout.write(ENABLED_NOTICE)
     
-    # Test loop
-    counter = 0
     try:
-        while True:
-            counter += 1
-            print(f"Running... ({counter}) - Protection active", end='\r')
-            time.sleep(1)
+        protection.wait_with_status("Running - protection active...")
+        
+        print(f"\n\n🛑 Shutdown detected: {protection.shutdown_reason}")
             
     except KeyboardInterrupt:
         print("\n\n🟡 Ctrl+C detected!")
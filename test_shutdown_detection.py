@@ -9,20 +9,30 @@ Usage:
     python test_shutdown_detection.py
 """
 
-import os
-import sys
-import time
+import ctypes
+from ctypes import wintypes
+import threading
 import logging
 
-# Add autoweb to path
-sys.path.insert(0, os.path.dirname(__file__))
+from autoweb.protection import (
+    ApplicationProtection, CTRL_CLOSE_EVENT, CTRL_LOGOFF_EVENT, CTRL_SHUTDOWN_EVENT
+)
 
-from autoweb.protection import ApplicationProtection
-
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds a console close/logoff/shutdown handler holds the process open
+# while main() unwinds (Windows ends it ~5 s after a close event)
+CONSOLE_UNWIND_TIMEOUT = 4.0
+
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+PHANDLER_ROUTINE = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.DWORD)
+_SetConsoleCtrlHandler = _kernel32.SetConsoleCtrlHandler
+_SetConsoleCtrlHandler.argtypes = [PHANDLER_ROUTINE, wintypes.BOOL]
+_SetConsoleCtrlHandler.restype = wintypes.BOOL
+
+
 def main():
+    logging.basicConfig(level=logging.INFO)
     print("🔍 Shutdown Detection Test")
     print("=" * 30)
     print()
@@ -33,6 +43,29 @@ def main():
     # Only setup power monitoring (not full protection)
     protection._setup_power_monitoring()
     
+    # Console close/logoff/shutdown never raise KeyboardInterrupt; they
+    # only wake the loop below, and the handler keeps the process alive
+    # until main() has unwound. Ctrl+C keeps its default handling.
+    console_events = {
+        CTRL_CLOSE_EVENT: "Console closed",
+        CTRL_LOGOFF_EVENT: "User logoff",
+        CTRL_SHUTDOWN_EVENT: "System shutdown",
+    }
+    unwound = threading.Event()
+    
+    def console_handler(ctrl_type):
+        reason = console_events.get(ctrl_type)
+        if reason is None:
+            return False
+        protection.request_shutdown(reason)
+        unwound.wait(CONSOLE_UNWIND_TIMEOUT)
+        return True
+    
+    # Kept in a local for the life of main() so it isn't garbage collected
+    handler = PHANDLER_ROUTINE(console_handler)
+    if not _SetConsoleCtrlHandler(handler, True):
+        logger.warning(f"Could not install console handler (error: {ctypes.get_last_error()})")
+    
     print("✅ Power monitoring enabled!")
     print()
     print("Test the following:")
@@ -45,17 +78,10 @@ def main():
     print()
     
     try:
-        counter = 0
-        while True:
-            # Check if shutdown was detected
-            if protection.should_shutdown:
-                print(f"\n\n🛑 DETECTED: {protection.shutdown_reason}")
-                print("Application would stop cleanly now!")
-                break
-                
-            counter += 1
-            print(f"Monitoring... {counter:03d}s", end='\r')
-            time.sleep(1)
+        protection.wait_with_status("Monitoring...")
+        
+        print(f"\n\n🛑 DETECTED: {protection.shutdown_reason}")
+        print("Application would stop cleanly now!")
     
     except KeyboardInterrupt:
         print("\n\nCtrl+C pressed - Normal exit")
@@ -63,7 +89,9 @@ def main():
     finally:
         # Cleanup
         protection._cleanup_power_monitoring()
+        _SetConsoleCtrlHandler(handler, False)
         print("Cleanup completed. Goodbye!")
+        unwound.set()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
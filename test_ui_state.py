@@ -0,0 +1,107 @@
+"""
+UI State Rendering Tests
+========================
+
+Unit tests for the pure helpers behind AutoWebApp's status redraws and
+activity log, plus the scheduler notifications that feed them.
+AutoWeb's modules bind Windows APIs at import, so the module is skipped
+on other platforms.
+
+Usage:
+    python -m unittest test_ui_state
+"""
+
+import collections
+import sys
+import unittest
+
+if sys.platform == "win32":
+    from autoweb.scheduler import AutomationScheduler, SchedulerState, AutomationPhase
+    from autoweb.ui import AutoWebApp, _collapse_repeats, _redraw_delay
+
+
+@unittest.skipUnless(sys.platform == "win32", "AutoWeb modules require Windows")
+class _WindowsTestCase(unittest.TestCase):
+    """Base for the tests below; skipped (with its subclasses) elsewhere."""
+
+
+class RedrawDelayTests(_WindowsTestCase):
+    """Rate limiting of status redraws (_redraw_delay)."""
+
+    def setUp(self):
+        self.min_interval = AutoWebApp.UI_MIN_INTERVAL
+
+    def test_first_state_renders_immediately(self):
+        state = SchedulerState(phase=AutomationPhase.ACTIVE, time_remaining=10)
+
+        self.assertEqual(_redraw_delay(state, None, 0.0, self.min_interval), 0.0)
+
+    def test_same_phase_update_inside_rate_limit_is_deferred(self):
+        last = SchedulerState(phase=AutomationPhase.ACTIVE, time_remaining=10)
+        state = SchedulerState(phase=AutomationPhase.ACTIVE, time_remaining=9)
+
+        delay = _redraw_delay(state, last, 0.1, self.min_interval)
+
+        self.assertAlmostEqual(delay, self.min_interval - 0.1)
+
+    def test_same_phase_update_after_rate_limit_renders_immediately(self):
+        last = SchedulerState(phase=AutomationPhase.ACTIVE, time_remaining=10)
+        state = SchedulerState(phase=AutomationPhase.ACTIVE, time_remaining=9)
+
+        self.assertEqual(_redraw_delay(state, last, self.min_interval, self.min_interval), 0.0)
+
+    def test_phase_change_inside_rate_limit_renders_immediately(self):
+        last = SchedulerState(phase=AutomationPhase.ACTIVE, time_remaining=10)
+        state = SchedulerState(phase=AutomationPhase.IDLE, time_remaining=30)
+
+        self.assertEqual(_redraw_delay(state, last, 0.01, self.min_interval), 0.0)
+
+
+class CollapseRepeatsTests(_WindowsTestCase):
+    """Folding repeated messages in the activity log."""
+
+    def test_repeats_fold_into_one_counted_entry(self):
+        pending = collections.deque([(1.0, "Scrolled down"), (2.0, "Scrolled down"),
+                                     (3.0, "Scrolled down")])
+
+        entries, replace_last, last_msg, last_count = _collapse_repeats(pending, None, 0)
+
+        self.assertEqual(entries, [(3.0, "Scrolled down", 3)])
+        self.assertFalse(replace_last)
+        self.assertEqual((last_msg, last_count), ("Scrolled down", 3))
+
+    def test_repeat_of_shown_line_replaces_it(self):
+        entries, replace_last, _, last_count = _collapse_repeats(
+            [(5.0, "Scrolled down")], "Scrolled down", 2
+        )
+
+        self.assertEqual(entries, [(5.0, "Scrolled down", 3)])
+        self.assertTrue(replace_last)
+        self.assertEqual(last_count, 3)
+
+    def test_distinct_messages_get_their_own_entries(self):
+        entries, replace_last, last_msg, last_count = _collapse_repeats(
+            [(1.0, "Scrolled down"), (2.0, "Switched tab")], None, 0
+        )
+
+        self.assertEqual(entries, [(1.0, "Scrolled down", 1), (2.0, "Switched tab", 1)])
+        self.assertFalse(replace_last)
+        self.assertEqual((last_msg, last_count), ("Switched tab", 1))
+
+
+class SchedulerActionTests(_WindowsTestCase):
+    """Scheduler actions reaching observers."""
+
+    def test_repeated_action_notifies_every_time(self):
+        states = []
+        scheduler = AutomationScheduler(on_state_change=states.append)
+
+        for _ in range(3):
+            scheduler._update_state(last_action="Scrolled down")
+
+        self.assertEqual([state.action_seq for state in states], [1, 2, 3])
+        self.assertEqual({state.last_action for state in states}, {"Scrolled down"})
+
+
+if __name__ == "__main__":
+    unittest.main()